@@ -15,7 +15,7 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from src.ingester import PriceIngester
 from src.utils.config import config
-from src.utils.logger import logger
+from src.utils.logger import logger, log_startup_banner
 from src.utils.scheduler import PriceScheduler
 from src.web_server import IngestionWebServer
 
@@ -56,7 +56,7 @@ class IngestionService:
             
             # Start web server first
             logger.info("🌐 Starting web server...")
-            self.web_server.start()
+            await self.web_server.start()
             logger.info("✅ Web server started successfully")
             
             # Initialize database
@@ -92,7 +92,7 @@ class IngestionService:
         try:
             if self.web_server:
                 logger.info("🌐 Stopping web server...")
-                self.web_server.stop()
+                await self.web_server.stop()
                 logger.info("✅ Web server stopped")
             
             if self.scheduler:
@@ -207,6 +207,7 @@ class IngestionService:
 
 async def main():
     """Main entry point."""
+    log_startup_banner()
     logger.info("🎬 Starting Stock Price Ingestion Service...")
     
     try:
@@ -241,7 +242,16 @@ if __name__ == "__main__":
         logger.info("🪟 Windows platform detected, configuring event loop policy...")
         asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
         logger.info("✅ Windows event loop policy configured")
-    
+    else:
+        # uvloop gives a substantial throughput boost on pool-heavy async
+        # workloads; it is not available on Windows, so fall back silently
+        try:
+            import uvloop
+            uvloop.install()
+            logger.info("⚡ uvloop event loop installed")
+        except ImportError:
+            logger.info("ℹ️  uvloop not available, using default asyncio event loop")
+
     logger.info("🚀 Launching Stock Price Ingestion Service...")
     
     # Run the service
@@ -8,7 +8,7 @@ from datetime import datetime, timedelta
 from typing import Optional, List
 import aiohttp
 
-from .base import BaseDataSource
+from .base import BaseDataSource, get_shared_connector
 from ..database.models import PriceData
 from ..exceptions import DataSourceError
 from ..utils.logger import logger
@@ -40,6 +40,8 @@ class AlphaVantageDataSource(BaseDataSource):
             logger.debug("🔌 Creating new Alpha Vantage HTTP session")
             timeout = aiohttp.ClientTimeout(total=30)  # Alpha Vantage can be slow
             self.session = aiohttp.ClientSession(
+                connector=get_shared_connector(),
+                connector_owner=False,
                 timeout=timeout,
                 headers={'User-Agent': 'StockAnomalySystem/1.0'}
             )
@@ -6,12 +6,44 @@ from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 import asyncio
+import time
+import aiohttp
 
 from ..database.models import PriceData
 from ..exceptions import DataSourceError
 from ..utils.logger import logger
 
 
+# One TCP connector shared by every HTTP-based data source. Sessions keep
+# their per-source headers and timeouts, but connections, TLS handshakes
+# and the DNS cache are pooled here, with per-host concurrency capped at
+# the connector level.
+_shared_connector: 'aiohttp.TCPConnector' = None
+
+
+def get_shared_connector() -> aiohttp.TCPConnector:
+    """Get (or lazily create) the connection pool shared by all sources."""
+    global _shared_connector
+    if _shared_connector is None or _shared_connector.closed:
+        _shared_connector = aiohttp.TCPConnector(
+            limit=128,
+            limit_per_host=64,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True
+        )
+        logger.debug("🔌 Shared HTTP connector created (limit=128, per-host=64)")
+    return _shared_connector
+
+
+async def close_shared_connector():
+    """Close the shared connection pool (call once at service shutdown)."""
+    global _shared_connector
+    if _shared_connector is not None and not _shared_connector.closed:
+        await _shared_connector.close()
+        logger.info("✅ Shared HTTP connector closed")
+    _shared_connector = None
+
+
 class RateLimiter:
     """Simple rate limiter for API calls."""
     
@@ -47,6 +79,49 @@ class RateLimiter:
             logger.debug(f"📝 Recorded API request at {now.strftime('%H:%M:%S')}, total calls: {len(self.calls)}")
 
 
+class TokenBucketLimiter:
+    """
+    Token-bucket rate limiter usable as an async context manager.
+
+    Unlike a fixed sleep between requests, the bucket refills continuously,
+    so permissive APIs are used at full speed while strict ones (e.g.
+    Alpha Vantage at 5 req/min) are throttled precisely to their limit.
+    """
+
+    def __init__(self, max_rate: int, time_period: float = 60.0):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._tokens = float(max_rate)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available, then consume it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    float(self.max_rate),
+                    self._tokens + (now - self._last_refill) * (self.max_rate / self.time_period)
+                )
+                self._last_refill = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait_time = (1 - self._tokens) * (self.time_period / self.max_rate)
+                logger.debug("⏳ Token bucket empty, waiting {:.2f}s", wait_time)
+                await asyncio.sleep(wait_time)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
 class BaseDataSource(ABC):
     """
     Abstract base class for all data sources.
@@ -96,6 +171,40 @@ class BaseDataSource(ABC):
         logger.debug(f"📚 {self.name} does not support historical data for {symbol}")
         return []
     
+    async def get_historical_data_batch(self, symbols: List[str], days: int = 30,
+                                        limiter=None) -> Dict[str, List[PriceData]]:
+        """
+        Fetch historical price data for multiple symbols.
+        Default implementation fans out one get_historical_data call per
+        symbol under a bounded semaphore - override in sources with a true
+        multi-symbol endpoint.
+
+        Args:
+            symbols: List of stock symbols
+            days: Number of days of historical data
+            limiter: Optional async context manager (e.g. a token bucket)
+                acquired around each individual upstream call, so rate
+                limits pace every request rather than the batch as a whole
+
+        Returns:
+            Dictionary mapping each symbol to its list of PriceData objects
+        """
+        semaphore = asyncio.Semaphore(5)
+
+        async def fetch_one(symbol: str) -> List[PriceData]:
+            try:
+                async with semaphore:
+                    if limiter is not None:
+                        async with limiter:
+                            return await self.get_historical_data(symbol, days=days)
+                    return await self.get_historical_data(symbol, days=days)
+            except DataSourceError as e:
+                logger.debug(f"⚠️  {self.name} batch fetch failed for {symbol}: {e}")
+                return []
+
+        results = await asyncio.gather(*(fetch_one(s) for s in symbols))
+        return dict(zip(symbols, results))
+
     async def can_make_request(self) -> bool:
         """Check if we can make a request within rate limits."""
         can_make = await self.rate_limiter.can_make_request()
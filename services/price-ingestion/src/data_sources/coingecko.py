@@ -8,7 +8,7 @@ from datetime import datetime
 from typing import Optional
 import aiohttp
 
-from .base import BaseDataSource
+from .base import BaseDataSource, get_shared_connector
 from ..database.models import PriceData
 from ..exceptions import DataSourceError
 from ..utils.logger import logger
@@ -36,6 +36,8 @@ class CoinGeckoDataSource(BaseDataSource):
         if not self.session or self.session.closed:
             timeout = aiohttp.ClientTimeout(total=15)
             self.session = aiohttp.ClientSession(
+                connector=get_shared_connector(),
+                connector_owner=False,
                 timeout=timeout,
                 headers={
                     'User-Agent': 'StockAnomalySystem/1.0'
@@ -8,7 +8,7 @@ from datetime import datetime
 from typing import Optional
 import aiohttp
 
-from .base import BaseDataSource
+from .base import BaseDataSource, get_shared_connector
 from ..database.models import PriceData
 from ..exceptions import DataSourceError
 from ..utils.logger import logger
@@ -37,6 +37,8 @@ class FinnhubDataSource(BaseDataSource):
         if not self.session or self.session.closed:
             timeout = aiohttp.ClientTimeout(total=10)
             self.session = aiohttp.ClientSession(
+                connector=get_shared_connector(),
+                connector_owner=False,
                 timeout=timeout,
                 headers={
                     'X-Finnhub-Token': self.api_key,
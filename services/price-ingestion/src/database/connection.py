@@ -6,14 +6,93 @@ import asyncio
 import asyncpg
 import json
 import os
+import time
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
 
 from .models import PriceData, StockInstrument
 from ..utils.config import config
 from ..utils.logger import logger
+from ..utils.symbols import is_crypto_symbol
 from ..exceptions import DatabaseError
 
+# Rows per executemany batch in bulk inserts. Large enough to amortize
+# transaction/commit cost over many tuples, small enough to keep statement
+# pipelines bounded.
+BULK_INSERT_BATCH_SIZE = 10_000
+
+# Statements re-issued on every stats/needs-data call. asyncpg keeps a
+# per-connection prepared-statement cache keyed by query text, so issuing
+# these module-level constants through the pool skips the parse/plan step
+# after each connection's first use.
+SQL_NEEDS_DATA = """
+SELECT (MAX(date) - MIN(date)) >= $2 AND MAX(date) >= $3 AS sufficient
+FROM daily_prices
+WHERE symbol = $1
+"""
+SQL_COUNT_INSTRUMENTS = 'SELECT COUNT(*) FROM instruments'
+SQL_INSERT_DAILY_PRICE = """
+INSERT INTO daily_prices (
+    symbol, date, open, high, low, close, volume,
+    source, metadata, created_at, updated_at
+) VALUES (
+    $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $10
+)
+ON CONFLICT (symbol, date)
+DO UPDATE SET
+    open = EXCLUDED.open,
+    high = EXCLUDED.high,
+    low = EXCLUDED.low,
+    close = EXCLUDED.close,
+    volume = EXCLUDED.volume,
+    source = EXCLUDED.source,
+    metadata = EXCLUDED.metadata,
+    updated_at = EXCLUDED.updated_at
+"""
+SQL_INSERT_CRYPTO_PRICE = """
+INSERT INTO crypto_prices (
+    symbol, timestamp, price_usd, volume_24h, market_cap_usd,
+    price_change_24h, price_change_percent_24h, source, metadata, created_at
+) VALUES (
+    $1, $2, $3, $4, $5, $6, $7, $8, $9, $10
+)
+ON CONFLICT (symbol, timestamp)
+DO UPDATE SET
+    price_usd = EXCLUDED.price_usd,
+    volume_24h = EXCLUDED.volume_24h,
+    market_cap_usd = EXCLUDED.market_cap_usd,
+    price_change_24h = EXCLUDED.price_change_24h,
+    price_change_percent_24h = EXCLUDED.price_change_percent_24h,
+    source = EXCLUDED.source,
+    metadata = EXCLUDED.metadata,
+    created_at = EXCLUDED.created_at
+"""
+SQL_INSERT_INTRADAY_PRICE = """
+INSERT INTO intraday_prices (
+    symbol, timestamp, open, high, low, close, volume, interval_minutes,
+    source, metadata, created_at
+) VALUES (
+    $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11
+)
+ON CONFLICT (symbol, timestamp, interval_minutes)
+DO UPDATE SET
+    open = EXCLUDED.open,
+    high = EXCLUDED.high,
+    low = EXCLUDED.low,
+    close = EXCLUDED.close,
+    volume = EXCLUDED.volume,
+    source = EXCLUDED.source,
+    metadata = EXCLUDED.metadata,
+    created_at = EXCLUDED.created_at
+"""
+SQL_COUNT_DAILY_PRICES = 'SELECT COUNT(*) FROM daily_prices'
+SQL_COUNT_CRYPTO_PRICES = 'SELECT COUNT(*) FROM crypto_prices'
+
+# How long a needs-historical-population verdict may be served from memory.
+# Startup and add_new_instrument ask the same question for the same symbol
+# within seconds; writes invalidate eagerly, the TTL is only a safety net.
+NEEDS_DATA_CACHE_TTL = 60.0
+
 
 class DatabaseManager:
     """
@@ -22,6 +101,9 @@ class DatabaseManager:
     
     def __init__(self):
         self.pool: Optional[asyncpg.Pool] = None
+        self._pool_max_size: int = 0
+        # {(symbol, min_days): (needs_population, expires_at)}
+        self._needs_data_cache: Dict[tuple, tuple] = {}
         self.stats = {
             'queries_executed': 0,
             'successful_queries': 0,
@@ -34,7 +116,7 @@ class DatabaseManager:
         """Initialize database connection pool."""
         try:
             logger.info("🔌 Initializing database connection pool...")
-            logger.info(f"📡 Database URL: {config.DATABASE_URL.split('@')[1] if '@' in config.DATABASE_URL else 'localhost'}")
+            logger.info("📡 Database URL: {}", config.DATABASE_URL.split('@')[1] if '@' in config.DATABASE_URL else 'localhost')
             
             # Create connection pool
             logger.debug("🔧 Creating connection pool...")
@@ -47,13 +129,17 @@ class DatabaseManager:
                     'jit': 'off'  # Disable JIT for better compatibility
                 }
             )
-            logger.info(f"✅ Connection pool created with size: {self.pool.get_size()}")
+            # Cache the pool size once - it only changes on pool create/close,
+            # so the hot stats path can read the attribute instead of walking
+            # the pool internals on every call
+            self._pool_max_size = self.pool.get_max_size()
+            logger.info("✅ Connection pool created with size: {}", self.pool.get_size())
             
             # Test connection
             logger.debug("🧪 Testing database connection...")
             async with self.pool.acquire() as conn:
                 test_result = await conn.fetchval('SELECT 1')
-                logger.info(f"✅ Database connection test successful: {test_result}")
+                logger.info("✅ Database connection test successful: {}", test_result)
             
             logger.info("✅ Database connection pool initialized successfully")
             
@@ -73,8 +159,8 @@ class DatabaseManager:
         Returns:
             True if successful, False otherwise
         """
-        logger.debug(f"💾 Attempting to store price data for {price_data.symbol}")
-        logger.debug(f"📊 Price data details: Open=${price_data.open_price}, Close=${price_data.close_price}, Volume={price_data.volume}, Date={price_data.timestamp.date()}")
+        logger.debug("💾 Attempting to store price data for {}", price_data.symbol)
+        logger.debug("📊 Price data details: Open=${}, Close=${}, Volume={}, Date={}", price_data.open_price, price_data.close_price, price_data.volume, price_data.timestamp.date())
         
         try:
             if not self.pool:
@@ -82,16 +168,16 @@ class DatabaseManager:
                 return False
             
             async with self.pool.acquire() as conn:
-                logger.debug(f"🔌 Acquired database connection for {price_data.symbol}")
+                logger.debug("🔌 Acquired database connection for {}", price_data.symbol)
                 
                 # First, ensure the instrument exists
-                logger.debug(f"🔧 Ensuring instrument exists for {price_data.symbol}...")
+                logger.debug("🔧 Ensuring instrument exists for {}...", price_data.symbol)
                 await self._ensure_instrument_exists(conn, price_data.symbol)
-                logger.debug(f"✅ Instrument ensured for {price_data.symbol}")
+                logger.debug("✅ Instrument ensured for {}", price_data.symbol)
                 
                 # Check if this is a cryptocurrency symbol
                 is_crypto = self._is_crypto_symbol(price_data.symbol)
-                logger.info(f"🔍 Symbol {price_data.symbol} is {'cryptocurrency' if is_crypto else 'stock'}")
+                logger.info("🔍 Symbol {} is {}", price_data.symbol, 'cryptocurrency' if is_crypto else 'stock')
                 
                 # Store intraday data if interval is specified
                 if interval_minutes and not is_crypto:
@@ -104,7 +190,7 @@ class DatabaseManager:
                     await self._store_stock_price(conn, price_data)
                 
                 self._update_stats(success=True)
-                logger.info(f"✅ Successfully stored price data for {price_data.symbol} in database")
+                logger.info("✅ Successfully stored price data for {} in database", price_data.symbol)
                 return True
                 
         except Exception as e:
@@ -122,28 +208,13 @@ class DatabaseManager:
             
             return False
     
-    def _is_crypto_symbol(self, symbol: str) -> bool:
-        """Check if a symbol is a cryptocurrency."""
-        # Check for common cryptocurrency symbols
-        crypto_symbols = ['BTC', 'ETH', 'ADA', 'DOT', 'LINK', 'LTC', 'BCH', 'XRP', 'XLM', 'EOS']
-        
-        # Check for slash notation (e.g., BTC/USD)
-        if '/' in symbol:
-            base = symbol.split('/')[0].upper()
-            return base in crypto_symbols
-        
-        # Check for dash notation (e.g., BTC-USD)
-        if '-' in symbol:
-            base = symbol.split('-')[0].upper()
-            return base in crypto_symbols
-        
-        # Check if the symbol itself is a known crypto
-        clean_symbol = symbol.upper().replace('USD', '').replace('USDT', '')
-        return clean_symbol in crypto_symbols
+    # Shared classifier (see utils.symbols) so table routing always agrees
+    # with how the scheduler and ingester classified the symbol
+    _is_crypto_symbol = staticmethod(is_crypto_symbol)
     
     async def _store_crypto_price(self, conn, price_data: PriceData):
         """Store cryptocurrency price data in crypto_prices table."""
-        logger.debug(f"💾 Storing crypto price for {price_data.symbol} in crypto_prices table")
+        logger.debug("💾 Storing crypto price for {} in crypto_prices table", price_data.symbol)
         
         try:
             # Extract crypto-specific data from metadata
@@ -187,9 +258,9 @@ class DatabaseManager:
                 datetime.now()
             ]
             
-            logger.debug(f"📝 Executing crypto price insert for {price_data.symbol}...")
+            logger.debug("📝 Executing crypto price insert for {}...", price_data.symbol)
             result = await conn.execute(query, *params)
-            logger.info(f"✅ Successfully stored crypto price for {price_data.symbol}: {result}")
+            logger.info("✅ Successfully stored crypto price for {}: {}", price_data.symbol, result)
             
             # Invalidate cache for this symbol after successful storage
             await self._invalidate_symbol_cache(price_data.symbol)
@@ -202,7 +273,7 @@ class DatabaseManager:
     
     async def _store_intraday_price(self, conn, price_data: PriceData, interval_minutes: int):
         """Store intraday price data in intraday_prices table."""
-        logger.debug(f"💾 Storing intraday price for {price_data.symbol} with {interval_minutes}min interval")
+        logger.debug("💾 Storing intraday price for {} with {}min interval", price_data.symbol, interval_minutes)
         
         try:
             query = """
@@ -241,9 +312,9 @@ class DatabaseManager:
                 datetime.now()
             ]
             
-            logger.debug(f"📝 Executing intraday price insert for {price_data.symbol}...")
+            logger.debug("📝 Executing intraday price insert for {}...", price_data.symbol)
             result = await conn.execute(query, *params)
-            logger.info(f"✅ Successfully stored intraday price for {price_data.symbol} ({interval_minutes}min): {result}")
+            logger.info("✅ Successfully stored intraday price for {} ({}min): {}", price_data.symbol, interval_minutes, result)
             
             # Invalidate cache for this symbol after successful storage
             await self._invalidate_symbol_cache(price_data.symbol)
@@ -256,7 +327,7 @@ class DatabaseManager:
     
     async def _store_stock_price(self, conn, price_data: PriceData):
         """Store stock price data in daily_prices table."""
-        logger.debug(f"💾 Storing stock price for {price_data.symbol} in daily_prices table")
+        logger.debug("💾 Storing stock price for {} in daily_prices table", price_data.symbol)
         
         try:
             query = """
@@ -294,9 +365,9 @@ class DatabaseManager:
                 datetime.now()
             ]
             
-            logger.debug(f"📝 Executing stock price insert for {price_data.symbol}...")
+            logger.debug("📝 Executing stock price insert for {}...", price_data.symbol)
             result = await conn.execute(query, *params)
-            logger.info(f"✅ Successfully stored stock price for {price_data.symbol}: {result}")
+            logger.info("✅ Successfully stored stock price for {}: {}", price_data.symbol, result)
             
             # Invalidate cache for this symbol after successful storage
             await self._invalidate_symbol_cache(price_data.symbol)
@@ -307,18 +378,229 @@ class DatabaseManager:
             logger.error(f"❌ Failed to store stock price for {price_data.symbol}: {type(e).__name__}: {e}")
             return False
     
-    async def store_historical_prices(self, symbol: str, price_data_list: List[PriceData]) -> Dict[str, Any]:
+    async def store_prices_bulk(self, price_data_list: List[PriceData],
+                                interval_minutes: int = None,
+                                intraday_data_list: List[PriceData] = None,
+                                intraday_interval: int = 5) -> Dict[str, Any]:
+        """
+        Store many price records with one executemany per destination table.
+
+        Rows are routed exactly like store_price routes a single record
+        (crypto vs daily vs intraday), but each table receives one pipelined
+        batch instead of a round-trip and transaction per row. A second
+        list of intraday rows can ride along in the same connection and
+        transaction, so a cycle's daily and intraday writes cost one
+        round-trip sequence instead of two.
+
+        Args:
+            price_data_list: PriceData objects to store
+            interval_minutes: If provided, non-crypto rows are stored as
+                intraday data with this interval
+            intraday_data_list: Additional rows stored as intraday data
+                alongside price_data_list
+            intraday_interval: Interval for the intraday_data_list rows
+
+        Returns:
+            Dictionary with results: {'success': bool, 'stored': int}
+        """
+        intraday_data_list = intraday_data_list or []
+        if not price_data_list and not intraday_data_list:
+            return {'success': True, 'stored': 0}
+
+        if not self.pool:
+            logger.error("❌ Database pool not initialized")
+            return {'success': False, 'stored': 0}
+
+        now = datetime.now()
+        crypto_rows, daily_rows, intraday_rows = [], [], []
+        for price_data in price_data_list:
+            metadata_json = json.dumps(price_data.metadata) if price_data.metadata else '{}'
+            if self._is_crypto_symbol(price_data.symbol):
+                metadata = price_data.metadata or {}
+                crypto_rows.append((
+                    price_data.symbol,
+                    price_data.timestamp,
+                    price_data.close_price,  # Use close_price as price_usd for crypto
+                    price_data.volume,
+                    metadata.get('market_cap_usd'),
+                    metadata.get('price_change_24h'),
+                    metadata.get('price_change_percent_24h'),
+                    getattr(price_data, 'source', 'coingecko'),
+                    metadata_json,
+                    now
+                ))
+            elif interval_minutes:
+                intraday_rows.append((
+                    price_data.symbol,
+                    price_data.timestamp,
+                    price_data.open_price,
+                    price_data.high_price,
+                    price_data.low_price,
+                    price_data.close_price,
+                    price_data.volume,
+                    interval_minutes,
+                    getattr(price_data, 'source', 'finnhub'),
+                    metadata_json,
+                    now
+                ))
+            else:
+                daily_rows.append((
+                    price_data.symbol,
+                    price_data.timestamp.date(),
+                    price_data.open_price,
+                    price_data.high_price,
+                    price_data.low_price,
+                    price_data.close_price,
+                    price_data.volume,
+                    getattr(price_data, 'source', 'finnhub'),
+                    metadata_json,
+                    now
+                ))
+
+        for price_data in intraday_data_list:
+            metadata_json = json.dumps(price_data.metadata) if price_data.metadata else '{}'
+            intraday_rows.append((
+                price_data.symbol,
+                price_data.timestamp,
+                price_data.open_price,
+                price_data.high_price,
+                price_data.low_price,
+                price_data.close_price,
+                price_data.volume,
+                intraday_interval,
+                getattr(price_data, 'source', 'finnhub'),
+                metadata_json,
+                now
+            ))
+
+        symbols = {p.symbol for p in price_data_list}
+        symbols.update(p.symbol for p in intraday_data_list)
+
+        try:
+            async with self.pool.acquire() as conn:
+                for symbol in symbols:
+                    await self._ensure_instrument_exists(conn, symbol)
+
+                async with conn.transaction():
+                    if daily_rows:
+                        await conn.executemany(SQL_INSERT_DAILY_PRICE, daily_rows)
+                    if crypto_rows:
+                        await conn.executemany(SQL_INSERT_CRYPTO_PRICE, crypto_rows)
+                    if intraday_rows:
+                        await conn.executemany(SQL_INSERT_INTRADAY_PRICE, intraday_rows)
+
+            self._update_stats(success=True)
+
+            # Invalidate cache once per symbol, not once per row
+            for symbol in symbols:
+                await self._invalidate_symbol_cache(symbol)
+
+            stored = len(daily_rows) + len(crypto_rows) + len(intraday_rows)
+            logger.info("✅ Bulk-stored {} price rows ({} daily, {} crypto, {} intraday)",
+                        stored, len(daily_rows), len(crypto_rows), len(intraday_rows))
+            return {'success': True, 'stored': stored}
+
+        except Exception as e:
+            self._update_stats(success=False)
+            logger.error(f"❌ Bulk price store failed: {type(e).__name__}: {e}")
+            return {'success': False, 'stored': 0}
+
+    async def copy_prices(self, price_data_list: List[PriceData],
+                          table: str = 'daily_prices') -> Dict[str, Any]:
+        """
+        Bulk-load daily price rows via COPY ... FROM STDIN.
+
+        asyncpg's binary COPY path is an order of magnitude faster than
+        even a pipelined multi-row INSERT, which makes it the right tool
+        for large historical backfills. COPY cannot upsert, so if any row
+        collides with existing data the whole load falls back to the
+        ON CONFLICT executemany path in store_prices_bulk.
+
+        Args:
+            price_data_list: PriceData objects to store
+            table: Destination table (daily price layout)
+
+        Returns:
+            Dictionary with results: {'success': bool, 'stored': int}
+        """
+        if not price_data_list:
+            return {'success': True, 'stored': 0}
+
+        if not self.pool:
+            logger.error("❌ Database pool not initialized")
+            return {'success': False, 'stored': 0}
+
+        # COPY writes the daily-price layout only; crypto rows belong in
+        # crypto_prices, so any batch containing them takes the routed
+        # upsert path instead of being loaded into the wrong table
+        if any(self._is_crypto_symbol(p.symbol) for p in price_data_list):
+            logger.debug("🔁 Crypto rows in COPY batch, routing via upsert bulk insert")
+            return await self.store_prices_bulk(price_data_list)
+
+        now = datetime.now()
+        records = []
+        for price_data in price_data_list:
+            metadata_json = json.dumps(price_data.metadata) if price_data.metadata else '{}'
+            records.append((
+                price_data.symbol,
+                price_data.timestamp.date(),
+                price_data.open_price,
+                price_data.high_price,
+                price_data.low_price,
+                price_data.close_price,
+                price_data.volume,
+                getattr(price_data, 'source', 'finnhub'),
+                metadata_json,
+                now,
+                now
+            ))
+
+        symbols = {p.symbol for p in price_data_list}
+
+        try:
+            async with self.pool.acquire() as conn:
+                for symbol in symbols:
+                    await self._ensure_instrument_exists(conn, symbol)
+
+                await conn.copy_records_to_table(
+                    table,
+                    records=records,
+                    columns=['symbol', 'date', 'open', 'high', 'low', 'close',
+                             'volume', 'source', 'metadata', 'created_at', 'updated_at']
+                )
+
+            self._update_stats(success=True)
+
+            for symbol in symbols:
+                await self._invalidate_symbol_cache(symbol)
+
+            logger.info("✅ COPY-loaded {} price rows into {}", len(records), table)
+            return {'success': True, 'stored': len(records)}
+
+        except asyncpg.UniqueViolationError:
+            # Some rows already exist; re-run through the upsert path
+            logger.info("🔁 COPY hit existing rows, retrying via upsert bulk insert")
+            return await self.store_prices_bulk(price_data_list)
+
+        except Exception as e:
+            self._update_stats(success=False)
+            logger.error(f"❌ COPY bulk load failed: {type(e).__name__}: {e}")
+            return {'success': False, 'stored': 0}
+
+    async def store_historical_prices(self, symbol: str, price_data_list: List[PriceData],
+                                      batch_size: int = BULK_INSERT_BATCH_SIZE) -> Dict[str, Any]:
         """
         Store multiple historical price records for a symbol.
-        
+
         Args:
             symbol: Stock/crypto symbol
             price_data_list: List of PriceData objects
-            
+            batch_size: Rows per bulk-insert batch
+
         Returns:
             Dictionary with results: {'success': bool, 'stored': int, 'skipped': int, 'errors': int}
         """
-        logger.info(f"💾 Storing {len(price_data_list)} historical prices for {symbol}")
+        logger.info("💾 Storing {} historical prices for {}", len(price_data_list), symbol)
         
         if not self.pool:
             logger.error("❌ Database pool not initialized")
@@ -329,39 +611,54 @@ class DatabaseManager:
             return {'success': True, 'stored': 0, 'skipped': 0, 'errors': 0}
         
         results = {'stored': 0, 'skipped': 0, 'errors': 0}
-        
+
         try:
+            # Validate up-front and build parameter tuples so the insert is a
+            # single pipelined executemany instead of one round-trip per row
+            now = datetime.now()
+            rows = []
+            for i, price_data in enumerate(price_data_list):
+                if not self._validate_price_data(price_data):
+                    logger.warning(f"⚠️  Skipping invalid price data for {symbol} at index {i}")
+                    results['skipped'] += 1
+                    continue
+                metadata_json = json.dumps(price_data.metadata) if price_data.metadata else '{}'
+                rows.append((
+                    price_data.symbol,
+                    price_data.timestamp.date(),
+                    price_data.open_price,
+                    price_data.high_price,
+                    price_data.low_price,
+                    price_data.close_price,
+                    price_data.volume,
+                    getattr(price_data, 'source', 'finnhub'),
+                    metadata_json,
+                    now
+                ))
+
             async with self.pool.acquire() as conn:
                 # Ensure instrument exists
                 await self._ensure_instrument_exists(conn, symbol)
-                
-                # Use a transaction for bulk insert
-                async with conn.transaction():
-                    for i, price_data in enumerate(price_data_list):
-                        try:
-                            # Validate price data
-                            if not self._validate_price_data(price_data):
-                                logger.warning(f"⚠️  Skipping invalid price data for {symbol} at index {i}")
-                                results['skipped'] += 1
-                                continue
-                            
-                            # Store the price
-                            success = await self._store_stock_price(conn, price_data)
-                            if success:
-                                results['stored'] += 1
-                                if (i + 1) % 100 == 0:  # Log progress every 100 records
-                                    logger.debug(f"📊 Progress: {i + 1}/{len(price_data_list)} prices stored for {symbol}")
-                            else:
-                                results['errors'] += 1
-                                
-                        except Exception as e:
-                            logger.error(f"❌ Error storing price {i} for {symbol}: {type(e).__name__}: {e}")
-                            results['errors'] += 1
-                            continue
-                
-                logger.info(f"✅ Historical prices stored for {symbol}: {results['stored']} stored, {results['skipped']} skipped, {results['errors']} errors")
-                return {'success': True, **results}
-                
+
+                # Bulk insert in bounded batches, one transaction per batch
+                for start in range(0, len(rows), batch_size):
+                    chunk = rows[start:start + batch_size]
+                    async with conn.transaction():
+                        await conn.executemany(SQL_INSERT_DAILY_PRICE, chunk)
+                    results['stored'] += len(chunk)
+                    logger.debug("📊 Progress: {}/{} prices stored for {}", results['stored'], len(rows), symbol)
+
+            # Invalidate cache once for the whole batch; also drop any
+            # cached needs-population verdict so it flips immediately
+            if results['stored']:
+                await self._invalidate_symbol_cache(symbol)
+                symbol_upper = symbol.upper()
+                for key in [k for k in self._needs_data_cache if k[0] == symbol_upper]:
+                    del self._needs_data_cache[key]
+
+            logger.info("✅ Historical prices stored for {}: {} stored, {} skipped, {} errors", symbol, results['stored'], results['skipped'], results['errors'])
+            return {'success': True, **results}
+
         except Exception as e:
             logger.error(f"❌ Failed to store historical prices for {symbol}: {type(e).__name__}: {e}")
             return {'success': False, 'stored': results['stored'], 'skipped': results['skipped'], 'errors': results['errors'], 'error': str(e)}
@@ -393,16 +690,26 @@ class DatabaseManager:
                 f"crypto:{symbol.upper()}:*"          # Crypto data
             ]
             
+            # SCAN + UNLINK instead of KEYS + DEL: SCAN never blocks Redis
+            # on a large keyspace and UNLINK frees memory on a background
+            # thread, so concurrent ingest traffic stays responsive
             total_cleared = 0
             for pattern in patterns:
-                keys = redis_client.keys(pattern)
-                if keys:
-                    redis_client.delete(*keys)
-                    total_cleared += len(keys)
-                    logger.debug(f"🧹 Cleared {len(keys)} cache entries for pattern: {pattern}")
+                batch = []
+                cursor = 0
+                while True:
+                    cursor, keys = redis_client.scan(cursor=cursor, match=pattern, count=500)
+                    batch.extend(keys)
+                    if cursor == 0:
+                        break
+                for i in range(0, len(batch), 1000):
+                    redis_client.unlink(*batch[i:i + 1000])
+                if batch:
+                    total_cleared += len(batch)
+                    logger.debug("🧹 Cleared {} cache entries for pattern: {}", len(batch), pattern)
             
             if total_cleared > 0:
-                logger.info(f"🧹 Cache invalidated for symbol: {symbol}, cleared {total_cleared} entries")
+                logger.info("🧹 Cache invalidated for symbol: {}, cleared {} entries", symbol, total_cleared)
             
             redis_client.close()
             
@@ -499,7 +806,7 @@ class DatabaseManager:
         Returns:
             PriceData object if found, None otherwise
         """
-        logger.debug(f"🔍 Fetching latest price for {symbol}")
+        logger.debug("🔍 Fetching latest price for {}", symbol)
         
         try:
             if not self.pool:
@@ -507,7 +814,7 @@ class DatabaseManager:
                 return None
             
             async with self.pool.acquire() as conn:
-                logger.debug(f"🔌 Acquired database connection for {symbol} query")
+                logger.debug("🔌 Acquired database connection for {} query", symbol)
                 
                 query = """
                 SELECT symbol, date, open, high, low, close, volume, 
@@ -518,12 +825,12 @@ class DatabaseManager:
                 LIMIT 1
                 """
                 
-                logger.debug(f"📝 Executing query for {symbol}: {query}")
+                logger.debug("📝 Executing query for {}: {}", symbol, query)
                 
                 row = await conn.fetchrow(query, symbol.upper())
                 
                 if row:
-                    logger.debug(f"✅ Found latest price for {symbol}: Close=${row['close']}, Date={row['date']}")
+                    logger.debug("✅ Found latest price for {}: Close=${}, Date={}", symbol, row['close'], row['date'])
                     # Convert date to datetime for timestamp field
                     timestamp = datetime.combine(row['date'], datetime.min.time()) if row['date'] else row['created_at']
                     return PriceData(
@@ -538,7 +845,7 @@ class DatabaseManager:
                         metadata=row['metadata']
                     )
                 else:
-                    logger.debug(f"⚠️  No price data found for {symbol}")
+                    logger.debug("⚠️  No price data found for {}", symbol)
                     return None
                 
         except Exception as e:
@@ -556,7 +863,7 @@ class DatabaseManager:
         Returns:
             List of PriceData objects
         """
-        logger.debug(f"📚 Fetching {days} days of historical prices for {symbol}")
+        logger.debug("📚 Fetching {} days of historical prices for {}", days, symbol)
         
         try:
             if not self.pool:
@@ -564,7 +871,7 @@ class DatabaseManager:
                 return []
             
             async with self.pool.acquire() as conn:
-                logger.debug(f"🔌 Acquired database connection for {symbol} historical query")
+                logger.debug("🔌 Acquired database connection for {} historical query", symbol)
                 
                 query = """
                 SELECT symbol, date, open, high, low, close, volume, 
@@ -574,10 +881,10 @@ class DatabaseManager:
                 ORDER BY date ASC
                 """ % days
                 
-                logger.debug(f"📝 Executing historical query for {symbol}: {query}")
+                logger.debug("📝 Executing historical query for {}: {}", symbol, query)
                 
                 rows = await conn.fetch(query, symbol.upper())
-                logger.info(f"📊 Retrieved {len(rows)} historical price records for {symbol}")
+                logger.info("📊 Retrieved {} historical price records for {}", len(rows), symbol)
                 
                 historical_data = []
                 for i, row in enumerate(rows):
@@ -596,12 +903,12 @@ class DatabaseManager:
                             metadata=row['metadata']
                         )
                         historical_data.append(price_data)
-                        logger.debug(f"✅ Parsed historical record {i+1}/{len(rows)} for {symbol}")
+                        logger.debug("✅ Parsed historical record {}/{} for {}", i+1, len(rows), symbol)
                     except Exception as e:
                         logger.warning(f"⚠️  Failed to parse historical record {i+1} for {symbol}: {e}")
                         continue
                 
-                logger.info(f"✅ Successfully retrieved {len(historical_data)} historical prices for {symbol}")
+                logger.info("✅ Successfully retrieved {} historical prices for {}", len(historical_data), symbol)
                 return historical_data
                 
         except Exception as e:
@@ -610,7 +917,7 @@ class DatabaseManager:
     
     async def _ensure_instrument_exists(self, conn, symbol: str):
         """Ensure the instrument exists in the instruments table."""
-        logger.debug(f"🔧 Ensuring instrument exists for {symbol}")
+        logger.debug("🔧 Ensuring instrument exists for {}", symbol)
         
         try:
             # Check if this is a cryptocurrency symbol
@@ -618,7 +925,7 @@ class DatabaseManager:
             instrument_type = 'CRYPTO' if is_crypto else 'STOCK'
             is_24h_trading = is_crypto  # Cryptocurrencies trade 24/7
             
-            logger.debug(f"🔍 Instrument {symbol} type: {instrument_type}, 24h trading: {is_24h_trading}")
+            logger.debug("🔍 Instrument {} type: {}, 24h trading: {}", symbol, instrument_type, is_24h_trading)
             
             query = """
             INSERT INTO instruments (
@@ -633,7 +940,7 @@ class DatabaseManager:
             """
             
             result = await conn.execute(query, symbol.upper(), symbol.upper(), instrument_type, is_24h_trading, datetime.now())
-            logger.debug(f"✅ Instrument ensured for {symbol}: {result}")
+            logger.debug("✅ Instrument ensured for {}: {}", symbol, result)
             
         except Exception as e:
             logger.error(f"❌ Failed to ensure instrument exists for {symbol}: {type(e).__name__}: {e}")
@@ -646,10 +953,10 @@ class DatabaseManager:
         
         if success:
             self.stats['successful_queries'] += 1
-            logger.debug(f"📊 Stats updated: successful query (total: {self.stats['successful_queries']})")
+            logger.debug("📊 Stats updated: successful query (total: {})", self.stats['successful_queries'])
         else:
             self.stats['failed_queries'] += 1
-            logger.debug(f"📊 Stats updated: failed query (total: {self.stats['failed_queries']})")
+            logger.debug("📊 Stats updated: failed query (total: {})", self.stats['failed_queries'])
     
     async def needs_historical_population(self, symbol: str, min_days: int = 90) -> bool:
         """
@@ -662,56 +969,44 @@ class DatabaseManager:
         Returns:
             True if historical population is needed, False otherwise
         """
-        logger.debug(f"🔍 Checking if {symbol} needs historical data population (min: {min_days} days)")
-        
+        logger.debug("🔍 Checking if {} needs historical data population (min: {} days)", symbol, min_days)
+
         if not self.pool:
             logger.error("❌ Database pool not initialized")
             return True  # Assume we need data if DB is not available
-        
+
+        # Serve recent verdicts from memory - startup and add_new_instrument
+        # ask the same question for the same symbol within seconds
+        cache_key = (symbol.upper(), min_days)
+        cached = self._needs_data_cache.get(cache_key)
+        if cached and cached[1] > time.monotonic():
+            logger.debug("💾 Using cached historical-population verdict for {}", symbol)
+            return cached[0]
+
         try:
+            # Postgres computes the coverage/recency predicate directly, so
+            # only a single boolean comes back over the wire. The aggregate
+            # returns NULL (i.e. not sufficient) when no rows exist.
+            cutoff_date = datetime.utcnow().date() - timedelta(days=7)
+
             async with self.pool.acquire() as conn:
-                # Check if we have enough recent data
-                query = """
-                SELECT COUNT(*) as count, 
-                       MIN(date) as earliest_date,
-                       MAX(date) as latest_date
-                FROM daily_prices 
-                WHERE symbol = $1
-                """
-                
-                row = await conn.fetchrow(query, symbol.upper())
-                
-                if not row or row['count'] == 0:
-                    logger.info(f"📊 {symbol}: No historical data found, needs population")
-                    return True
-                
-                count = row['count']
-                earliest_date = row['earliest_date']
-                latest_date = row['latest_date']
-                
-                # Calculate days of data coverage
-                if earliest_date and latest_date:
-                    days_covered = (latest_date - earliest_date).days
-                    logger.debug(f"📊 {symbol}: Found {count} records covering {days_covered} days")
-                    
-                    # Check if we have enough data and it's recent enough
-                    # Make datetime timezone-aware for comparison
-                    import pytz
-                    now_utc = datetime.now(pytz.UTC)
-                    cutoff_date = now_utc - timedelta(days=7)
-                    
-                    if days_covered >= min_days and latest_date >= cutoff_date:
-                        logger.info(f"✅ {symbol}: Sufficient historical data available ({days_covered} days, latest: {latest_date.date()})")
-                        return False
-                    else:
-                        logger.info(f"📊 {symbol}: Insufficient or outdated data ({days_covered} days, latest: {latest_date.date()}), needs population")
-                        return True
-                else:
-                    logger.warning(f"⚠️  {symbol}: Invalid date range in database, needs population")
-                    return True
-                    
-        except Exception as e:
-            logger.error(f"❌ Failed to check historical data needs for {symbol}: {type(e).__name__}: {e}")
+                sufficient = await conn.fetchval(
+                    SQL_NEEDS_DATA, symbol.upper(), min_days, cutoff_date
+                )
+
+            needs_population = not sufficient
+            self._needs_data_cache[cache_key] = (needs_population, time.monotonic() + NEEDS_DATA_CACHE_TTL)
+
+            if sufficient:
+                logger.info("✅ {}: Sufficient historical data available", symbol)
+            else:
+                logger.info("📊 {}: Missing, insufficient or outdated data, needs population", symbol)
+            return needs_population
+
+        except (asyncpg.PostgresError, asyncio.TimeoutError, OSError):
+            # Only transient database/connectivity errors are expected here;
+            # programmer errors propagate so they surface during development
+            logger.error("❌ Failed to check historical data needs for {}", symbol)
             return True  # Assume we need data if there's an error
     
     async def get_stats(self) -> Dict[str, Any]:
@@ -726,25 +1021,26 @@ class DatabaseManager:
             async with self.pool.acquire() as conn:
                 logger.debug("🔌 Acquired connection for stats query")
                 
-                # Get table row counts
-                instruments_count = await conn.fetchval('SELECT COUNT(*) FROM instruments')
-                stock_prices_count = await conn.fetchval('SELECT COUNT(*) FROM daily_prices')
-                crypto_prices_count = await conn.fetchval('SELECT COUNT(*) FROM crypto_prices')
+                # Get table row counts; asyncpg's statement cache reuses the
+                # prepared plans for these constant queries
+                instruments_count = await conn.fetchval(SQL_COUNT_INSTRUMENTS)
+                stock_prices_count = await conn.fetchval(SQL_COUNT_DAILY_PRICES)
+                crypto_prices_count = await conn.fetchval(SQL_COUNT_CRYPTO_PRICES)
                 
                 stats = {
                     'status': 'connected',
-                    'pool_size': self.pool.get_size(),
+                    'pool_size': self._pool_max_size,
                     'instruments_count': instruments_count,
                     'stock_prices_count': stock_prices_count,
                     'crypto_prices_count': crypto_prices_count,
                     **self.stats
                 }
                 
-                logger.debug(f"📊 Database stats: {stats}")
+                logger.debug("📊 Database stats: {}", stats)
                 return stats
                 
-        except Exception as e:
-            logger.error(f"❌ Failed to get database stats: {type(e).__name__}: {e}")
+        except (asyncpg.PostgresError, asyncio.TimeoutError, OSError) as e:
+            logger.error("❌ Failed to get database stats")
             return {
                 'status': 'error',
                 'error': str(e),
@@ -757,6 +1053,7 @@ class DatabaseManager:
             logger.info("🔄 Closing database connection pool...")
             await self.pool.close()
             self.pool = None
+            self._pool_max_size = 0
             logger.info("✅ Database connection pool closed")
         else:
             logger.debug("⚠️  Database pool already closed or not initialized")
\ No newline at end of file
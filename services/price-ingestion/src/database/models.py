@@ -2,10 +2,15 @@
 Database models for stock price data.
 """
 
+import os
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, Dict, Any
 
+# Row validation runs on every ingested price. Trusted bulk loads can set
+# PRICE_VALIDATE=0 to skip it entirely.
+VALIDATE = os.environ.get('PRICE_VALIDATE', '1') == '1'
+
 
 @dataclass
 class PriceData:
@@ -25,16 +30,17 @@ class PriceData:
     def __post_init__(self):
         """Validate and normalize data after initialization."""
         self.symbol = self.symbol.upper()
-        
-        # Validate required fields
-        if not self.symbol:
-            raise ValueError("Symbol is required")
-        if self.close_price is None or self.close_price <= 0:
+
+        if not VALIDATE:
+            return
+
+        # Single composite check for the required fields; close_price is
+        # typed float (not Optional) so a None would raise TypeError on the
+        # comparison anyway
+        if not (self.symbol and self.timestamp and self.source):
+            raise ValueError("Symbol, timestamp and source are required")
+        if self.close_price <= 0:
             raise ValueError("Close price must be positive")
-        if not self.timestamp:
-            raise ValueError("Timestamp is required")
-        if not self.source:
-            raise ValueError("Source is required")
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -45,29 +51,60 @@ class PriceData:
             'low': self.low_price,
             'close': self.close_price,
             'volume': self.volume,
-            'timestamp': self.timestamp.isoformat() if self.timestamp else None,
+            # Native datetime: the cache serializer encodes it in C, and
+            # from_dict accepts either form when it comes back
+            'timestamp': self.timestamp,
             'source': self.source,
             'metadata': self.metadata
         }
-    
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'PriceData':
         """Create PriceData from dictionary."""
-        timestamp = data.get('timestamp')
-        if isinstance(timestamp, str):
-            timestamp = datetime.fromisoformat(timestamp)
-        
-        return cls(
-            symbol=data['symbol'],
-            open_price=data.get('open'),
-            high_price=data.get('high'),
-            low_price=data.get('low'),
-            close_price=data['close'],
-            volume=data.get('volume'),
-            timestamp=timestamp,
-            source=data['source'],
-            metadata=data.get('metadata', {})
-        )
+        try:
+            # Generated straight-line constructor for the full to_dict schema
+            return _fast_from_dict(cls, data)
+        except KeyError:
+            # Partial payload from another writer - use per-field fallbacks
+            timestamp = data.get('timestamp')
+            if isinstance(timestamp, str):
+                timestamp = datetime.fromisoformat(timestamp)
+
+            return cls(
+                symbol=data['symbol'],
+                open_price=data.get('open'),
+                high_price=data.get('high'),
+                low_price=data.get('low'),
+                close_price=data['close'],
+                volume=data.get('volume'),
+                timestamp=timestamp,
+                source=data['source'],
+                metadata=data.get('metadata', {})
+            )
+
+
+# to_dict always emits the complete fixed schema, so the hot cache-hit
+# deserialization path can run a generated straight-line constructor with
+# direct indexing instead of a chain of .get fallbacks; from_dict drops to
+# the flexible path only when a key is missing.
+_FAST_FROM_DICT_SRC = """
+def _fast_from_dict(cls, data):
+    timestamp = data['timestamp']
+    if type(timestamp) is str:
+        timestamp = datetime.fromisoformat(timestamp)
+    return cls(
+        symbol=data['symbol'],
+        open_price=data['open'],
+        high_price=data['high'],
+        low_price=data['low'],
+        close_price=data['close'],
+        volume=data['volume'],
+        timestamp=timestamp,
+        source=data['source'],
+        metadata=data['metadata']
+    )
+"""
+exec(compile(_FAST_FROM_DICT_SRC, __file__, 'exec'), globals())
 
 
 @dataclass
@@ -4,16 +4,31 @@ Coordinates between different data sources and manages data flow.
 """
 
 import asyncio
-from datetime import datetime, timedelta
+import traceback
+from datetime import datetime, time, timedelta, timezone
+from time import monotonic
 from typing import Dict, List, Optional
 
 from .data_sources import DataSourceFactory
+from .data_sources.base import TokenBucketLimiter, close_shared_connector
 from .database.connection import DatabaseManager
 from .database.models import PriceData
 from .utils.cache import CacheManager
 from .utils.config import config
 from .utils.logger import logger
 from .exceptions import IngestionError, DataSourceError
+from .utils.symbols import is_crypto_symbol
+
+# Shared classifier (see utils.symbols) so the ingester routes symbols
+# exactly like the scheduler's crypto job and the database layer
+_classify_crypto_symbol = is_crypto_symbol
+
+# Which sources can serve which symbol class, and in what preference order.
+# Yahoo Finance does NOT support crypto symbols; CoinGecko is crypto-only.
+_CRYPTO_SOURCES = frozenset({'coingecko', 'finnhub'})
+_STOCK_SOURCES = frozenset({'finnhub', 'yahoo', 'alpha_vantage'})
+_CRYPTO_HISTORICAL_PRIORITY = ('coingecko', 'yahoo', 'finnhub')
+_STOCK_HISTORICAL_PRIORITY = ('alpha_vantage', 'yahoo', 'finnhub')
 
 
 class PriceIngester:
@@ -25,7 +40,40 @@ class PriceIngester:
         self.db_manager = DatabaseManager()
         self.cache_manager = CacheManager()
         self.data_sources = DataSourceFactory.create_all()
-        self.symbols = config.TRACKED_SYMBOLS
+        # Ordered (name, source) tuples in try-priority order, built once
+        # so the per-symbol fetch path doesn't re-filter the source dict
+        self._crypto_sources = tuple(
+            (n, self.data_sources[n]) for n in ('coingecko', 'finnhub', 'yahoo')
+            if n in self.data_sources
+        )
+        self._stock_sources = tuple(
+            (n, self.data_sources[n]) for n in ('alpha_vantage', 'yahoo', 'finnhub')
+            if n in self.data_sources
+        )
+        # List preserves deterministic ingestion order; the parallel set
+        # gives O(1) membership checks in add_new_instrument/ingest_symbol
+        self.symbols = list(config.TRACKED_SYMBOLS)
+        self._symbols_set = set(self.symbols)
+        # Precomputed crypto subset of the tracked symbols so hot paths get
+        # an O(1) set lookup instead of repeated string parsing
+        self._crypto_set = {s for s in self.symbols if _classify_crypto_symbol(s)}
+        # Market-hours boundaries never change at runtime; build the time
+        # objects once instead of on every _is_market_hours call
+        self._market_open_t = time(config.MARKET_OPEN_HOUR, config.MARKET_OPEN_MINUTE)
+        self._market_close_t = time(config.MARKET_CLOSE_HOUR, config.MARKET_CLOSE_MINUTE)
+        # Per-source token buckets for historical fetches: permissive
+        # sources run at full speed while Alpha Vantage is held to its
+        # 5 requests/minute limit (keyed by BaseDataSource.name)
+        self._limiters = {
+            'CoinGecko': TokenBucketLimiter(30, 60),
+            'AlphaVantage': TokenBucketLimiter(5, 60),
+            'Finnhub': TokenBucketLimiter(58, 60),
+            'Yahoo': TokenBucketLimiter(30, 60),
+        }
+        # Prices collected during a cycle are buffered here and flushed
+        # with one bulk insert per table at the end of ingest_prices
+        self._pending_prices: List[PriceData] = []
+        self._pending_intraday: List[PriceData] = []
         self.stats = {
             'total_requests': 0,
             'successful_requests': 0,
@@ -76,22 +124,25 @@ class PriceIngester:
         logger.info(f"📊 Symbols to check: {self.symbols}")
         
         try:
-            # Check each symbol individually for historical data needs
+            # Check all symbols concurrently - the checks are independent
+            # SELECTs, so latency is one round-trip instead of one per symbol
             logger.info("🔍 Step 1: Checking historical data requirements for each symbol...")
+            check_results = await asyncio.gather(
+                *(self.db_manager.needs_historical_population(s, min_days=90) for s in self.symbols),
+                return_exceptions=True
+            )
+
             symbols_needing_data = []
-            
-            for symbol in self.symbols:
-                try:
-                    needs_population = await self.db_manager.needs_historical_population(symbol, min_days=90)
-                    if needs_population:
-                        symbols_needing_data.append(symbol)
-                        logger.info(f"📊 {symbol}: Needs historical data population")
-                    else:
-                        logger.info(f"✅ {symbol}: Sufficient historical data available")
-                except Exception as e:
-                    logger.warning(f"⚠️  Error checking {symbol} historical data needs: {e}")
+            for symbol, needs_population in zip(self.symbols, check_results):
+                if isinstance(needs_population, Exception):
+                    logger.warning(f"⚠️  Error checking {symbol} historical data needs: {needs_population}")
                     symbols_needing_data.append(symbol)  # Assume it needs data if we can't check
-            
+                elif needs_population:
+                    symbols_needing_data.append(symbol)
+                    logger.debug("📊 {}: Needs historical data population", symbol)
+                else:
+                    logger.debug("✅ {}: Sufficient historical data available", symbol)
+
             if not symbols_needing_data:
                 logger.info("✅ All symbols have sufficient historical data, no population needed")
                 return
@@ -107,29 +158,15 @@ class PriceIngester:
         except Exception as e:
             logger.error(f"❌ Startup data initialization failed: {type(e).__name__}: {e}")
             logger.error(f"🔍 Full error details: {str(e)}")
-            import traceback
             logger.error(f"📋 Stack trace: {traceback.format_exc()}")
             logger.warning("⚠️  Continuing with service startup despite historical data failure")
     
     def _is_crypto_symbol(self, symbol: str) -> bool:
         """Check if a symbol is a cryptocurrency."""
-        # Check for common cryptocurrency symbols
-        crypto_symbols = ['BTC', 'ETH', 'ADA', 'DOT', 'LINK', 'LTC', 'BCH', 'XRP', 'XLM', 'EOS']
-        
-        # Check for slash notation (e.g., BTC/USD)
-        if '/' in symbol:
-            base = symbol.split('/')[0].upper()
-            return base in crypto_symbols
-        
-        # Check for dash notation (e.g., BTC-USD)
-        if '-' in symbol:
-            base = symbol.split('-')[0].upper()
-            return base in crypto_symbols
-        
-        # Check if the symbol itself is a known crypto
-        clean_symbol = symbol.upper().replace('USD', '').replace('USDT', '')
-        return clean_symbol in crypto_symbols
-    
+        # Tracked symbols resolve with one set lookup; the memoized parser
+        # only runs for symbols seen before add_new_instrument records them
+        return symbol in self._crypto_set or _classify_crypto_symbol(symbol)
+
     def _should_fetch_24h(self, symbol: str) -> bool:
         """Check if a symbol should be fetched 24/7 (cryptocurrency)."""
         return self._is_crypto_symbol(symbol)
@@ -142,35 +179,21 @@ class PriceIngester:
             True if during market hours, False otherwise
         """
         try:
-            import pytz
-            from datetime import time
-            utc_tz = pytz.timezone('UTC')
-            now_utc = datetime.now(utc_tz)
-            
+            now_utc = datetime.now(timezone.utc)
+
             # Check if it's a weekday (Monday = 0, Sunday = 6)
             if now_utc.weekday() > 4:  # Saturday = 5, Sunday = 6
                 return False
-            
-            current_time = now_utc.time()
-            market_open = time(config.MARKET_OPEN_HOUR, config.MARKET_OPEN_MINUTE)
-            market_close = time(config.MARKET_CLOSE_HOUR, config.MARKET_CLOSE_MINUTE)
-            
-            return market_open <= current_time <= market_close
-            
+
+            return self._market_open_t <= now_utc.time() <= self._market_close_t
+
         except Exception as e:
             logger.warning(f"Error checking market hours: {e}")
             return False
     
     def _is_source_appropriate_for_symbol(self, source_name: str, symbol: str) -> bool:
         """Check if a data source is appropriate for a given symbol type."""
-        is_crypto = self._is_crypto_symbol(symbol)
-        
-        if is_crypto:
-            # Only CoinGecko and Finnhub support crypto - Yahoo Finance does NOT support crypto symbols
-            return source_name in ['coingecko', 'finnhub']
-        else:
-            # Exclude CoinGecko for stocks, use stock-appropriate sources
-            return source_name in ['finnhub', 'yahoo', 'alpha_vantage']
+        return source_name in (_CRYPTO_SOURCES if self._is_crypto_symbol(symbol) else _STOCK_SOURCES)
 
     async def _check_recent_data_exists(self) -> bool:
         """
@@ -180,18 +203,31 @@ class PriceIngester:
             True if recent data exists, False otherwise
         """
         logger.debug("🔍 Checking for recent price data in database...")
-        
+
         try:
-            # Check if we have any data from the last 7 days
-            for symbol in self.symbols:
-                historical_data = await self.db_manager.get_historical_prices(symbol, days=7)
-                if historical_data:
-                    logger.info(f"✅ Found {len(historical_data)} recent price records for {symbol}")
-                    return True
-            
+            # Any one symbol with data from the last 7 days is enough, so
+            # race the queries and cancel the rest on the first hit
+            tasks = {
+                asyncio.create_task(self.db_manager.get_historical_prices(symbol, days=7)): symbol
+                for symbol in self.symbols
+            }
+
+            pending = set(tasks)
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        historical_data = task.result()
+                        if historical_data:
+                            logger.info(f"✅ Found {len(historical_data)} recent price records for {tasks[task]}")
+                            return True
+            finally:
+                for task in pending:
+                    task.cancel()
+
             logger.warning("⚠️  No recent price data found for any symbols")
             return False
-            
+
         except Exception as e:
             logger.error(f"❌ Error checking recent data: {type(e).__name__}: {e}")
             return False
@@ -221,7 +257,7 @@ class PriceIngester:
         
         for symbol in self.symbols:
             try:
-                logger.info(f"📊 Populating historical data for {symbol}...")
+                logger.debug("📊 Populating historical data for {}...", symbol)
                 
                 # Get the best source for this specific symbol type
                 symbol_source = self._get_best_historical_source_for_symbol(symbol)
@@ -229,30 +265,30 @@ class PriceIngester:
                     logger.warning(f"⚠️  No suitable historical data source found for {symbol}, skipping")
                     continue
                 
-                logger.info(f"🎯 Using {symbol_source.name} for {symbol} historical data")
+                logger.debug("🎯 Using {} for {} historical data", symbol_source.name, symbol)
                 
-                # Fetch historical data (7 days should be enough for startup)
-                historical_data = await symbol_source.get_historical_data(symbol, days=7)
+                # Fetch historical data (7 days should be enough for startup),
+                # pacing per source through its token bucket
+                limiter = self._limiters.get(symbol_source.name)
+                if limiter:
+                    async with limiter:
+                        historical_data = await symbol_source.get_historical_data(symbol, days=7)
+                else:
+                    historical_data = await symbol_source.get_historical_data(symbol, days=7)
                 
                 if not historical_data:
                     logger.warning(f"⚠️  No historical data received for {symbol}")
                     continue
                 
-                logger.info(f"📥 Received {len(historical_data)} historical data points for {symbol}")
-                
-                # Store in database
-                stored_count = 0
-                for price_data in historical_data:
-                    try:
-                        success = await self.db_manager.store_price(price_data)
-                        if success:
-                            stored_count += 1
-                        else:
-                            logger.warning(f"⚠️  Failed to store historical data point for {symbol}")
-                    except Exception as e:
-                        logger.warning(f"⚠️  Error storing historical data point for {symbol}: {e}")
-                        continue
-                
+                logger.debug("📥 Received {} historical data points for {}", len(historical_data), symbol)
+
+                # Store in database as one bulk insert instead of a
+                # round-trip per data point
+                storage_result = await self.db_manager.store_historical_prices(symbol, historical_data)
+                stored_count = storage_result['stored']
+                if not storage_result['success']:
+                    logger.warning(f"⚠️  Failed to store historical data for {symbol}: {storage_result.get('error', 'Unknown error')}")
+
                 # Store in cache (most recent data)
                 if historical_data:
                     latest_data = historical_data[-1]  # Most recent
@@ -263,11 +299,8 @@ class PriceIngester:
                         logger.warning(f"⚠️  Failed to cache latest price for {symbol}: {e}")
                 
                 total_populated += stored_count
-                logger.info(f"✅ Successfully populated {symbol} with {stored_count}/{len(historical_data)} historical data points")
-                
-                # Rate limiting between symbols
-                await asyncio.sleep(1)
-                
+                logger.debug("✅ Successfully populated {} with {}/{} historical data points", symbol, stored_count, len(historical_data))
+
             except Exception as e:
                 logger.error(f"❌ Failed to populate historical data for {symbol}: {type(e).__name__}: {e}")
                 continue
@@ -283,63 +316,86 @@ class PriceIngester:
             symbols: List of symbols that need historical data population
         """
         logger.info(f"📚 Starting historical data population for {len(symbols)} symbols...")
-        
-        total_populated = 0
-        
+
+        # Group symbols by their best historical source so sources with a
+        # multi-symbol endpoint can serve a whole group in one upstream
+        # request instead of one call per symbol
+        source_groups = {}
         for symbol in symbols:
+            symbol_source = self._get_best_historical_source_for_symbol(symbol)
+            if not symbol_source:
+                logger.warning(f"⚠️  No suitable historical data source found for {symbol}, skipping")
+                continue
+            source_groups.setdefault(symbol_source.name, (symbol_source, []))[1].append(symbol)
+
+        total_populated = 0
+        cache_updates = []
+
+        async def populate_group(source_name: str, symbol_source, group: List[str]) -> int:
             try:
-                logger.info(f"📊 Populating historical data for {symbol}...")
-                
-                # Get data limits for this symbol
-                limits = self.db_manager.get_historical_data_limits(symbol)
-                max_days = limits['max_days']
-                logger.info(f"📅 {symbol}: Maximum historical data allowed: {max_days} days")
-                
-                # Get the best source for this specific symbol type
-                symbol_source = self._get_best_historical_source_for_symbol(symbol)
-                if not symbol_source:
-                    logger.warning(f"⚠️  No suitable historical data source found for {symbol}, skipping")
-                    continue
-                
-                logger.info(f"🎯 Using {symbol_source.name} for {symbol} historical data")
-                
-                # Fetch historical data with API limit validation
-                historical_data = await self._fetch_historical_data_with_limits(
-                    symbol, symbol_source, max_days
+                # One conservative day limit per group keeps the batch call
+                # valid for every symbol in it
+                max_days = min(
+                    self.db_manager.get_historical_data_limits(s)['max_days'] for s in group
                 )
-                
+                logger.info(f"📡 Fetching historical data for {len(group)} symbols from {source_name} ({max_days} day limit)")
+                # The limiter goes into the batch call so each upstream
+                # request takes a token; acquiring it once out here would
+                # let one token admit the whole group back-to-back
+                batch_data = await symbol_source.get_historical_data_batch(
+                    group, days=max_days, limiter=self._limiters.get(source_name)
+                )
+            except Exception as e:
+                logger.error(f"❌ Batch historical fetch from {source_name} failed: {type(e).__name__}: {e}")
+                return 0
+
+            populated = 0
+            low, high = self._valid_window()
+            for symbol in group:
+                historical_data = [
+                    p for p in batch_data.get(symbol) or []
+                    if p.symbol and p.timestamp and p.close_price and p.close_price > 0
+                    and low <= p.timestamp <= high
+                ]
+
                 if not historical_data:
                     logger.warning(f"⚠️  No historical data received for {symbol}")
                     continue
-                
-                logger.info(f"📥 Received {len(historical_data)} historical data points for {symbol}")
-                
+
+                logger.debug("📥 Received {} historical data points for {}", len(historical_data), symbol)
+
                 # Store in database using bulk storage
                 storage_result = await self.db_manager.store_historical_prices(symbol, historical_data)
-                
-                if storage_result['success']:
-                    stored_count = storage_result['stored']
-                    total_populated += stored_count
-                    logger.info(f"✅ Successfully populated {symbol} with {stored_count}/{len(historical_data)} historical data points")
-                    
-                    # Store in cache (most recent data)
-                    if historical_data:
-                        latest_data = historical_data[-1]  # Most recent
-                        try:
-                            await self.cache_manager.set_price(symbol, latest_data, ttl_seconds=3600)  # 1 hour TTL
-                            logger.debug(f"💾 Cached latest price for {symbol}")
-                        except Exception as e:
-                            logger.warning(f"⚠️  Failed to cache latest price for {symbol}: {e}")
-                else:
+
+                if not storage_result['success']:
                     logger.error(f"❌ Failed to store historical data for {symbol}: {storage_result.get('error', 'Unknown error')}")
-                
-                # Rate limiting between symbols to respect API limits
-                await asyncio.sleep(2)
-                
-            except Exception as e:
-                logger.error(f"❌ Failed to populate historical data for {symbol}: {type(e).__name__}: {e}")
-                continue
-        
+                    continue
+
+                stored_count = storage_result['stored']
+                populated += stored_count
+                logger.debug("✅ Successfully populated {} with {}/{} historical data points", symbol, stored_count, len(historical_data))
+
+                # Defer the cache write; all symbols go out in one pipeline
+                cache_updates.append((symbol, historical_data[-1]))
+
+            return populated
+
+        # The groups hit distinct upstream APIs, so they run concurrently;
+        # within a group the source's batch endpoint (or its bounded
+        # per-symbol fallback) governs the fan-out
+        group_counts = await asyncio.gather(
+            *(populate_group(name, src, grp) for name, (src, grp) in source_groups.items()),
+            return_exceptions=True
+        )
+        for count in group_counts:
+            if isinstance(count, Exception):
+                logger.error(f"❌ Historical population group failed: {type(count).__name__}: {count}")
+            else:
+                total_populated += count
+
+        # Single pipelined round-trip instead of one SET per symbol
+        await self.cache_manager.set_prices_bulk(cache_updates, ttl_seconds=3600)  # 1 hour TTL
+
         logger.info(f"🎉 Historical data population completed: {total_populated} total data points stored")
     
     async def _fetch_historical_data_with_limits(self, symbol: str, data_source, max_days: int) -> List[PriceData]:
@@ -370,14 +426,24 @@ class PriceIngester:
                 logger.warning(f"⚠️  No historical data received from {data_source.name} for {symbol}")
                 return []
             
-            # Validate and filter the data
-            validated_data = []
-            for price_data in historical_data:
-                if self._validate_historical_price_data(price_data, symbol):
-                    validated_data.append(price_data)
-                else:
-                    logger.debug(f"⚠️  Skipping invalid historical data point for {symbol}")
-            
+            # Validate and filter the data in one pass; the comprehension
+            # avoids the per-row append/bound-method overhead and keeps no
+            # second shadow copy of the rejected rows. The valid timestamp
+            # window is computed once, not per row.
+            low, high = self._valid_window()
+            try:
+                validated_data = [
+                    p for p in historical_data
+                    if p.symbol and p.timestamp and p.close_price and p.close_price > 0
+                    and low <= p.timestamp <= high
+                ]
+            except Exception as e:
+                logger.warning(f"⚠️  Historical price data validation error for {symbol}: {e}")
+                validated_data = [
+                    p for p in historical_data
+                    if self._validate_historical_price_data(p, symbol)
+                ]
+
             logger.info(f"✅ Validated {len(validated_data)}/{len(historical_data)} historical data points for {symbol}")
             return validated_data
             
@@ -385,6 +451,11 @@ class PriceIngester:
             logger.error(f"❌ Failed to fetch historical data for {symbol}: {type(e).__name__}: {e}")
             return []
     
+    def _valid_window(self) -> tuple:
+        """Return the (oldest, newest) timestamps accepted for historical rows."""
+        now = datetime.now()
+        return now - timedelta(days=365 * 2), now + timedelta(days=1)
+
     def _validate_historical_price_data(self, price_data: PriceData, symbol: str) -> bool:
         """
         Validate historical price data before storage.
@@ -405,15 +476,10 @@ class PriceIngester:
             if not price_data.close_price or price_data.close_price <= 0:
                 return False
             
-            # Check timestamp is reasonable
-            now = datetime.now()
-            if price_data.timestamp > now + timedelta(days=1):
-                return False
-            
-            if price_data.timestamp < now - timedelta(days=365*2):  # Not more than 2 years in past
-                return False
-            
-            return True
+            # Check timestamp is reasonable (no more than 2 years old and
+            # at most a day in the future)
+            low, high = self._valid_window()
+            return low <= price_data.timestamp <= high
             
         except Exception as e:
             logger.warning(f"⚠️  Historical price data validation error for {symbol}: {e}")
@@ -433,69 +499,65 @@ class PriceIngester:
         
         try:
             # Check if symbol is already being tracked
-            if symbol in self.symbols:
+            if symbol in self._symbols_set:
                 logger.info(f"ℹ️  {symbol} is already being tracked")
                 return True
-            
-            # Check if we need historical data for this symbol
-            needs_population = await self.db_manager.needs_historical_population(symbol, min_days=90)
-            
-            if needs_population:
-                logger.info(f"📊 {symbol}: Needs historical data population")
-                
-                # Get data limits for this symbol
-                limits = self.db_manager.get_historical_data_limits(symbol)
-                max_days = limits['max_days']
-                logger.info(f"📅 {symbol}: Maximum historical data allowed: {max_days} days")
-                
-                # Get the best source for this symbol type
-                symbol_source = self._get_best_historical_source_for_symbol(symbol)
-                if not symbol_source:
-                    logger.error(f"❌ No suitable data source found for {symbol}")
-                    return False
-                
-                logger.info(f"🎯 Using {symbol_source.name} for {symbol} historical data")
-                
-                # Fetch and store historical data
-                historical_data = await self._fetch_historical_data_with_limits(
-                    symbol, symbol_source, max_days
-                )
-                
-                if historical_data:
-                    # Store in database
-                    storage_result = await self.db_manager.store_historical_prices(symbol, historical_data)
-                    
-                    if storage_result['success']:
-                        logger.info(f"✅ Successfully populated {symbol} with {storage_result['stored']} historical data points")
-                        
-                        # Add to tracking list
-                        self.symbols.append(symbol)
-                        logger.info(f"✅ {symbol} added to tracking list")
-                        
-                        # Store in cache
-                        latest_data = historical_data[-1]
-                        try:
-                            await self.cache_manager.set_price(symbol, latest_data, ttl_seconds=3600)
-                            logger.debug(f"💾 Cached latest price for {symbol}")
-                        except Exception as e:
-                            logger.warning(f"⚠️  Failed to cache latest price for {symbol}: {e}")
-                        
-                        # Invalidate API cache for this new symbol
-                        await self._invalidate_api_cache(symbol)
-                        
-                        return True
-                    else:
-                        logger.error(f"❌ Failed to store historical data for {symbol}: {storage_result.get('error', 'Unknown error')}")
-                        return False
-                else:
-                    logger.error(f"❌ No historical data received for {symbol}")
-                    return False
-            else:
-                logger.info(f"✅ {symbol}: Already has sufficient historical data")
-                # Add to tracking list even if no population needed
-                self.symbols.append(symbol)
-                logger.info(f"✅ {symbol} added to tracking list")
-                return True
+
+            # A symbol we have never tracked almost certainly has no data,
+            # so skip the needs_historical_population round-trip and fetch
+            # directly - the bulk upsert is idempotent if rows do exist
+            logger.info(f"📊 {symbol}: New symbol, populating historical data")
+
+            # Get data limits for this symbol
+            limits = self.db_manager.get_historical_data_limits(symbol)
+            max_days = limits['max_days']
+            logger.info(f"📅 {symbol}: Maximum historical data allowed: {max_days} days")
+
+            # Get the best source for this symbol type
+            symbol_source = self._get_best_historical_source_for_symbol(symbol)
+            if not symbol_source:
+                logger.error(f"❌ No suitable data source found for {symbol}")
+                return False
+
+            logger.debug("🎯 Using {} for {} historical data", symbol_source.name, symbol)
+
+            # Fetch and store historical data
+            historical_data = await self._fetch_historical_data_with_limits(
+                symbol, symbol_source, max_days
+            )
+
+            if not historical_data:
+                logger.error(f"❌ No historical data received for {symbol}")
+                return False
+
+            # Store in database
+            storage_result = await self.db_manager.store_historical_prices(symbol, historical_data)
+
+            if not storage_result['success']:
+                logger.error(f"❌ Failed to store historical data for {symbol}: {storage_result.get('error', 'Unknown error')}")
+                return False
+
+            logger.info(f"✅ Successfully populated {symbol} with {storage_result['stored']} historical data points")
+
+            # Add to tracking list
+            self.symbols.append(symbol)
+            self._symbols_set.add(symbol)
+            if _classify_crypto_symbol(symbol):
+                self._crypto_set.add(symbol)
+            logger.info(f"✅ {symbol} added to tracking list")
+
+            # Store in cache
+            latest_data = historical_data[-1]
+            try:
+                await self.cache_manager.set_price(symbol, latest_data, ttl_seconds=3600)
+                logger.debug(f"💾 Cached latest price for {symbol}")
+            except Exception as e:
+                logger.warning(f"⚠️  Failed to cache latest price for {symbol}: {e}")
+
+            # Invalidate API cache for this new symbol
+            await self._invalidate_api_cache(symbol)
+
+            return True
                 
         except Exception as e:
             logger.error(f"❌ Failed to add new instrument {symbol}: {type(e).__name__}: {e}")
@@ -504,43 +566,13 @@ class PriceIngester:
     async def _invalidate_api_cache(self, symbol: str):
         """Invalidate API cache for a specific symbol after data changes."""
         try:
-            # Import here to avoid circular imports
-            import redis
-            import os
-            
-            # Get Redis configuration from environment
-            redis_host = os.getenv('REDIS_HOST', 'localhost')
-            redis_port = int(os.getenv('REDIS_PORT', 6379))
-            redis_password = os.getenv('REDIS_PASSWORD', 'redis_secure_password')
-            
-            # Create Redis client
-            redis_client = redis.Redis(
-                host=redis_host,
-                port=redis_port,
-                password=redis_password,
-                decode_responses=True
-            )
-            
-            # Clear all cache entries related to this symbol
-            patterns = [
-                f"price:{symbol.upper()}:*",           # Current prices
-                f"historical:{symbol.upper()}:*",      # Historical data
-                f"crypto:{symbol.upper()}:*"          # Crypto data
-            ]
-            
-            total_cleared = 0
-            for pattern in patterns:
-                keys = redis_client.keys(pattern)
-                if keys:
-                    redis_client.delete(*keys)
-                    total_cleared += len(keys)
-                    logger.debug(f"🧹 Cleared {len(keys)} API cache entries for pattern: {pattern}")
-            
+            # Reuse the already-connected async cache client instead of
+            # opening a throwaway sync connection per invalidation
+            total_cleared = await self.cache_manager.invalidate_symbol(symbol)
+
             if total_cleared > 0:
                 logger.info(f"🧹 API cache invalidated for symbol: {symbol}, cleared {total_cleared} entries")
-            
-            redis_client.close()
-            
+
         except Exception as e:
             logger.warning(f"⚠️  Failed to invalidate API cache for {symbol}: {type(e).__name__}: {e}")
             # Don't fail the main operation if cache invalidation fails
@@ -556,7 +588,7 @@ class PriceIngester:
         logger.info(f"🔍 Available data sources: {list(self.data_sources.keys())}")
         
         # Priority order: Alpha Vantage (best for historical), Yahoo, Finnhub
-        priority_order = ['alpha_vantage', 'yahoo', 'finnhub']
+        priority_order = _STOCK_HISTORICAL_PRIORITY
         logger.info(f"🎯 Priority order for historical data: {priority_order}")
         
         for source_name in priority_order:
@@ -585,22 +617,19 @@ class PriceIngester:
         """
         is_crypto = self._is_crypto_symbol(symbol)
         logger.debug(f"🔍 Selecting best historical data source for {symbol} (crypto: {is_crypto})")
-        
-        if is_crypto:
-            # For crypto, CoinGecko is best, then fallbacks
-            priority_order = ['coingecko', 'yahoo', 'finnhub']
-        else:
-            # For stocks, Alpha Vantage is best, then fallbacks
-            priority_order = ['alpha_vantage', 'yahoo', 'finnhub']
-        
+
+        # CoinGecko is best for crypto, Alpha Vantage for stocks; fallbacks follow
+        priority_order = _CRYPTO_HISTORICAL_PRIORITY if is_crypto else _STOCK_HISTORICAL_PRIORITY
         logger.info(f"🎯 Priority order for {symbol} historical data: {priority_order}")
-        
-        for source_name in priority_order:
-            if source_name in self.data_sources:
-                source = self.data_sources[source_name]
-                logger.info(f"✅ Selected {source.name} for {symbol} historical data")
-                return source
-        
+
+        source = next(
+            (self.data_sources[name] for name in priority_order if name in self.data_sources),
+            None
+        )
+        if source:
+            logger.info(f"✅ Selected {source.name} for {symbol} historical data")
+            return source
+
         logger.error(f"❌ No suitable historical data source found for {symbol}")
         return None
 
@@ -614,15 +643,10 @@ class PriceIngester:
         logger.debug("🔍 Checking cache status...")
         
         try:
-            cache_hits = 0
-            for symbol in self.symbols:
-                cached_price = await self.cache_manager.get_price(symbol)
-                if cached_price:
-                    cache_hits += 1
-                    logger.debug(f"✅ Cache hit for {symbol}")
-                else:
-                    logger.debug(f"❌ Cache miss for {symbol}")
-            
+            # Single MGET round-trip instead of one GET per symbol
+            cached_prices = await self.cache_manager.get_prices(self.symbols)
+            cache_hits = sum(1 for price in cached_prices.values() if price)
+
             if cache_hits > 0:
                 logger.info(f"✅ Cache has data for {cache_hits}/{len(self.symbols)} symbols")
                 return True
@@ -641,9 +665,11 @@ class PriceIngester:
         Returns:
             Dict with ingestion results and statistics
         """
-        start_time = datetime.now()
+        # Monotonic clock for the duration; one wall-clock read covers the
+        # timestamp fields
+        start_monotonic = monotonic()
         results = {
-            'timestamp': start_time.isoformat(),
+            'timestamp': datetime.now().isoformat(),
             'symbols_processed': 0,
             'symbols_successful': 0,
             'symbols_failed': 0,
@@ -655,36 +681,79 @@ class PriceIngester:
         logger.info(f"📊 Symbols to process: {self.symbols}")
         logger.info(f"🔧 Available data sources: {list(self.data_sources.keys())}")
         
-        # Log symbol type classification
-        crypto_symbols = [s for s in self.symbols if self._is_crypto_symbol(s)]
-        stock_symbols = [s for s in self.symbols if not self._is_crypto_symbol(s)]
+        # Log symbol type classification - single pass over the precomputed
+        # crypto set instead of re-classifying the list twice
+        crypto_symbols, stock_symbols = [], []
+        for s in self.symbols:
+            (crypto_symbols if s in self._crypto_set else stock_symbols).append(s)
         logger.info(f"🔍 Symbol classification: {len(crypto_symbols)} crypto, {len(stock_symbols)} stocks")
         if crypto_symbols:
             logger.info(f"🔍 Crypto symbols: {crypto_symbols}")
         if stock_symbols:
             logger.info(f"🔍 Stock symbols: {stock_symbols}")
         
-        # Process symbols concurrently (but with rate limiting)
-        semaphore = asyncio.Semaphore(5)  # Limit concurrent requests
-        tasks = []
-        
+        # One MGET up-front splits the tracked list into fresh-cached
+        # symbols and symbols that need an upstream fetch, instead of one
+        # GET per symbol inside _process_symbol
+        cached_prices = await self.cache_manager.get_prices(self.symbols)
+
+        # Market-hours status is the same for every symbol in the cycle;
+        # evaluate it once here rather than per buffered price
+        in_market_hours = self._is_market_hours()
+
+        symbols_to_fetch = []
         for symbol in self.symbols:
-            task = self._process_symbol_with_semaphore(semaphore, symbol, results)
-            tasks.append(task)
-        
-        logger.info(f"📋 Created {len(tasks)} ingestion tasks")
-        
-        # Wait for all tasks to complete
+            cached = cached_prices.get(symbol)
+            if cached and self._is_cache_fresh(cached):
+                results['symbols_processed'] += 1
+                results['symbols_successful'] += 1
+                self._buffer_price(cached, in_market_hours)
+            else:
+                symbols_to_fetch.append(symbol)
+
+        logger.info(f"💾 {len(self.symbols) - len(symbols_to_fetch)} symbols fresh in cache, {len(symbols_to_fetch)} need fetching")
+
+        # Process remaining symbols with a bounded worker pool. A queue
+        # drained by a fixed number of workers keeps peak task state flat
+        # regardless of symbol count and gives clean cancellation, unlike
+        # scheduling every symbol up-front in one big gather()
+        n_workers = min(5, max(len(symbols_to_fetch), 1))  # Limit concurrent requests
+        queue: asyncio.Queue = asyncio.Queue(maxsize=len(symbols_to_fetch) or 1)
+        for symbol in symbols_to_fetch:
+            queue.put_nowait(symbol)
+
+        async def worker():
+            while True:
+                symbol = await queue.get()
+                try:
+                    await self._process_symbol(symbol, results, in_market_hours)
+                except Exception as e:
+                    # _process_symbol handles its own errors; this guards the worker loop
+                    logger.error(f"💥 Worker error processing {symbol}: {type(e).__name__}: {e}")
+                finally:
+                    queue.task_done()
+
+        workers = [asyncio.create_task(worker()) for _ in range(n_workers)]
+        logger.info(f"📋 Started {n_workers} ingestion workers for {len(symbols_to_fetch)} symbols")
+
+        # Wait for the queue to drain, then retire the workers
         logger.info("⏳ Waiting for all ingestion tasks to complete...")
-        await asyncio.gather(*tasks, return_exceptions=True)
-        
+        await queue.join()
+        for w in workers:
+            w.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+        # Flush everything fetched this cycle in one bulk insert per table
+        if not await self._flush_pending_prices():
+            logger.error("❌ Bulk price flush failed for this cycle")
+
         # Update statistics
         self.stats['total_requests'] += results['symbols_processed']
         self.stats['successful_requests'] += results['symbols_successful']
         self.stats['failed_requests'] += results['symbols_failed']
-        self.stats['last_run'] = start_time.isoformat()
-        
-        duration = (datetime.now() - start_time).total_seconds()
+        self.stats['last_run'] = results['timestamp']
+
+        duration = monotonic() - start_monotonic
         
         logger.info(
             f"✅ Ingestion completed in {duration:.2f}s. "
@@ -703,139 +772,47 @@ class PriceIngester:
         
         return results
     
-    async def _process_symbol_with_semaphore(self, semaphore: asyncio.Semaphore, 
-                                           symbol: str, results: Dict):
-        """Process a single symbol with concurrency control."""
-        async with semaphore:
-            await self._process_symbol(symbol, results)
-    
-    async def _process_symbol(self, symbol: str, results: Dict):
+    async def _process_symbol(self, symbol: str, results: Dict, in_market_hours: bool):
         """Process a single symbol through the data source chain."""
         results['symbols_processed'] += 1
-        logger.info(f"🔄 Processing symbol: {symbol} ({results['symbols_processed']}/{len(self.symbols)})")
+        logger.debug("🔄 Processing symbol: {} ({}/{})", symbol, results['symbols_processed'], len(self.symbols))
         
         try:
-            # Check cache first
-            logger.debug(f"🔍 Checking cache for {symbol}...")
-            cached_price = await self.cache_manager.get_price(symbol)
-            if cached_price and self._is_cache_fresh(cached_price):
-                logger.info(f"✅ Using cached price for {symbol} (cache hit)")
-                # Even with cache hit, ensure data is stored in database
-                logger.debug(f"💾 Ensuring cached data for {symbol} is stored in database...")
-                # Convert cached dict back to PriceData object
-                from .database.models import PriceData
-                cached_price_obj = PriceData.from_dict(cached_price)
-                # Store both daily and intraday data for stocks
-                is_crypto = self._is_crypto_symbol(symbol)
-                if not is_crypto:
-                    # Store as daily data
-                    store_success = await self.db_manager.store_price(cached_price_obj)
-                    # Also store as 5-minute intraday data during market hours
-                    if self._is_market_hours():
-                        await self.db_manager.store_price(cached_price_obj, interval_minutes=5)
-                else:
-                    # Crypto only goes to crypto_prices table
-                    store_success = await self.db_manager.store_price(cached_price_obj)
-                
-                if store_success:
-                    logger.info(f"✅ Successfully stored cached {symbol} in database")
-                else:
-                    logger.error(f"❌ Failed to store cached {symbol} in database")
-                results['symbols_successful'] += 1
-                return
-            
-            if cached_price:
-                logger.debug(f"⏰ Cached price for {symbol} is stale, fetching fresh data")
-            else:
-                logger.debug(f"❌ No cached price found for {symbol}, fetching fresh data")
-            
-            # Select appropriate data sources based on symbol type
-            price_data = None
-            source_used = None
-            
-            # Determine if this is a cryptocurrency symbol
-            is_crypto = self._is_crypto_symbol(symbol)
-            logger.info(f"🔍 Symbol {symbol} is {'cryptocurrency' if is_crypto else 'stock'}")
-            
-            # Filter data sources based on symbol type
-            if is_crypto:
-                # For crypto, try CoinGecko first, then fallback to other sources
-                crypto_sources = ['coingecko', 'finnhub', 'yahoo']
-                available_sources = {k: v for k, v in self.data_sources.items() if k in crypto_sources}
-                logger.info(f"🔍 Using crypto-appropriate sources for {symbol}: {list(available_sources.keys())}")
-            else:
-                # For stocks, prioritize sources with volume data (Alpha Vantage, Yahoo) over Finnhub
-                stock_sources = ['alpha_vantage', 'yahoo', 'finnhub']
-                available_sources = {k: v for k, v in self.data_sources.items() if k in stock_sources}
-                logger.info(f"🔍 Using stock-appropriate sources for {symbol} (volume-priority order): {list(available_sources.keys())}")
-            
-            logger.info(f"🔍 Attempting to fetch {symbol} from {len(available_sources)} appropriate data sources...")
-            
-            for source_name, source in available_sources.items():
-                try:
-                    if not await source.can_make_request():
-                        logger.debug(f"⏳ {source_name} rate limited for {symbol}, trying next source")
-                        continue
-                    
-                    logger.debug(f"🔍 Trying {source_name} for {symbol}...")
-                    price_data = await source.get_price(symbol)
-                    
-                    if price_data:
-                        source_used = source_name
-                        logger.info(f"✅ {source_name} successfully provided data for {symbol}")
-                        break
-                    else:
-                        logger.warning(f"⚠️  {source_name} returned no data for {symbol}")
-                        
-                except DataSourceError as e:
-                    logger.debug(f"⚠️  {source_name} failed for {symbol}: {e} (trying next source)")
-                    continue
-                except Exception as e:
-                    logger.warning(f"⚠️  Unexpected error from {source_name} for {symbol}: {type(e).__name__}: {e}")
-                    continue
-            
+            # Stale-while-revalidate: a stale cached value is served (and
+            # buffered) immediately while a single background task refreshes
+            # it; only a true cache miss awaits the upstream fetch inline
+            source_used_box = {}
+
+            async def fetch_fresh():
+                price, source_name = await self._fetch_price_from_sources(symbol)
+                if source_name:
+                    source_used_box['name'] = source_name
+                return price
+
+            price_data = await self.cache_manager.get_or_set_swr(symbol, fetch_fresh)
+            source_used = source_used_box.get('name')
+
             if not price_data:
                 error_msg = f"All data sources failed for {symbol}"
                 logger.error(f"💥 {error_msg}")
                 raise IngestionError(error_msg)
-            
+
             # Log the price data we're about to store
-            logger.info(f"💾 Storing price data for {symbol}: Open=${price_data.open_price}, Close=${price_data.close_price}, Volume={price_data.volume}")
-            
-            # Store in database
-            logger.debug(f"💾 Attempting to store {symbol} in database...")
-            
-            # Store both daily and intraday data for stocks
-            is_crypto = self._is_crypto_symbol(symbol)
-            if not is_crypto:
-                # Store as daily data
-                store_success = await self.db_manager.store_price(price_data)
-                # Also store as 5-minute intraday data during market hours
-                if self._is_market_hours():
-                    await self.db_manager.store_price(price_data, interval_minutes=5)
-                    logger.debug(f"📊 Also stored 5-minute intraday data for {symbol}")
-            else:
-                # Crypto only goes to crypto_prices table
-                store_success = await self.db_manager.store_price(price_data)
-            
-            if store_success:
-                logger.info(f"✅ Successfully stored {symbol} in database")
-            else:
-                logger.error(f"❌ Failed to store {symbol} in database")
-                raise IngestionError(f"Database storage failed for {symbol}")
-            
-            # Update cache
-            logger.debug(f"💾 Updating cache for {symbol}...")
-            await self.cache_manager.set_price(symbol, price_data)
-            logger.debug(f"✅ Cache updated for {symbol}")
-            
+            logger.debug("💾 Queuing price data for {}: Open=${}, Close=${}, Volume={}", symbol, price_data.open_price, price_data.close_price, price_data.volume)
+
+            # Buffer for the end-of-cycle bulk insert instead of paying a
+            # database round-trip per symbol
+            self._buffer_price(price_data, in_market_hours)
+
             # Update statistics
             results['symbols_successful'] += 1
             if source_used:
                 results['sources_used'][source_used] = results['sources_used'].get(source_used, 0) + 1
                 self.stats['sources_used'][source_used] = self.stats['sources_used'].get(source_used, 0) + 1
             
-            logger.info(f"🎉 Successfully processed {symbol} from {source_used}")
+            # Per-symbol success is DEBUG (deferred formatting) - the cycle
+            # summary in ingest_prices covers the INFO-level story
+            logger.debug("🎉 Successfully processed {} from {}", symbol, source_used)
             
         except Exception as e:
             results['symbols_failed'] += 1
@@ -844,49 +821,161 @@ class PriceIngester:
             logger.error(f"💥 Failed to process {symbol}: {type(e).__name__}: {e}")
             logger.error(f"💥 Error details for {symbol}: {error_msg}")
     
-    def _is_cache_fresh(self, cached_data: Dict, max_age_minutes: int = 15) -> bool:
-        """Check if cached data is still fresh."""
-        if not cached_data.get('timestamp'):
-            logger.debug("Cache data has no timestamp, considering stale")
-            return False
-        
+    async def _fetch_price_from_sources(self, symbol: str) -> tuple:
+        """
+        Try the symbol-appropriate data sources in priority order.
+
+        Args:
+            symbol: Stock/crypto symbol to fetch
+
+        Returns:
+            Tuple of (PriceData or None, source name or None)
+        """
+        # Determine if this is a cryptocurrency symbol
+        is_crypto = self._is_crypto_symbol(symbol)
+        logger.debug("🔍 Symbol {} is {}", symbol, 'cryptocurrency' if is_crypto else 'stock')
+
+        # Pick the pre-built priority tuple for this symbol type: CoinGecko
+        # leads for crypto, volume-bearing sources (Alpha Vantage, Yahoo)
+        # lead for stocks
+        source_iter = self._crypto_sources if is_crypto else self._stock_sources
+
+        candidates = []
+        for source_name, source in source_iter:
+            if await source.can_make_request():
+                candidates.append((source_name, source))
+            else:
+                logger.debug("⏳ {} rate limited for {}, skipping", source_name, symbol)
+
+        if not candidates:
+            return None, None
+
+        logger.debug("🔍 Racing {} appropriate data sources for {}...", len(candidates), symbol)
+
+        # Race the candidates instead of awaiting them strictly in turn, so
+        # one slow source (e.g. Alpha Vantage at its 20s timeout) no longer
+        # delays the others. Each lower-priority source starts with an extra
+        # half-second head start for the one above it, so a healthy preferred
+        # source still wins - and the laggards are cancelled before they
+        # spend a request against their rate limits.
+        async def attempt(source, delay: float):
+            if delay:
+                await asyncio.sleep(delay)
+            return await source.get_price(symbol)
+
+        tasks = {
+            asyncio.create_task(attempt(source, i * 0.5)): source_name
+            for i, (source_name, source) in enumerate(candidates)
+        }
+
+        price_data, source_used = None, None
         try:
-            cache_time = datetime.fromisoformat(cached_data['timestamp'])
-            age = datetime.now() - cache_time
-            is_fresh = age < timedelta(minutes=max_age_minutes)
-            logger.debug(f"Cache age: {age.total_seconds()/60:.1f} minutes, fresh: {is_fresh}")
-            return is_fresh
-        except Exception as e:
-            logger.warning(f"Error parsing cache timestamp: {e}")
+            while tasks and price_data is None:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    source_name = tasks.pop(task)
+                    try:
+                        result = task.result()
+                    except DataSourceError as e:
+                        logger.debug("⚠️  {} failed for {}: {}", source_name, symbol, e)
+                        continue
+                    except Exception as e:
+                        logger.warning(f"⚠️  Unexpected error from {source_name} for {symbol}: {type(e).__name__}: {e}")
+                        continue
+
+                    if result:
+                        logger.debug("✅ {} successfully provided data for {}", source_name, symbol)
+                        price_data, source_used = result, source_name
+                        break
+                    else:
+                        logger.warning(f"⚠️  {source_name} returned no data for {symbol}")
+        finally:
+            # Retire whichever attempts are still pending
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+        return price_data, source_used
+
+    def _buffer_price(self, price_data: PriceData, in_market_hours: bool):
+        """Queue a price record for the end-of-cycle bulk flush."""
+        self._pending_prices.append(price_data)
+        # Stocks also get a 5-minute intraday row during market hours;
+        # the caller evaluates market hours once per cycle and threads it in
+        if not self._should_fetch_24h(price_data.symbol) and in_market_hours:
+            self._pending_intraday.append(price_data)
+
+    async def _flush_pending_prices(self) -> bool:
+        """Flush buffered prices with one bulk insert per destination table."""
+        if not self._pending_prices and not self._pending_intraday:
+            return True
+
+        # Snapshot-and-swap before awaiting so rows buffered concurrently
+        # (the crypto job can overlap a market cycle) land in the next
+        # flush instead of being dropped by a post-await reassignment
+        pending, self._pending_prices = self._pending_prices, []
+        pending_intraday, self._pending_intraday = self._pending_intraday, []
+
+        # Daily/crypto and intraday rows ship in one connection acquire
+        # and one transaction instead of two separate bulk calls
+        result = await self.db_manager.store_prices_bulk(
+            pending,
+            intraday_data_list=pending_intraday,
+            intraday_interval=5
+        )
+
+        return result['success']
+
+    def _is_cache_fresh(self, cached_data: PriceData, max_age_minutes: int = 15) -> bool:
+        """Check if cached price data is still fresh."""
+        # The cache stamps every write with a float epoch, so freshness is
+        # a numeric compare; entries without the stamp (pre-upgrade or
+        # foreign writers) just count as stale and get refetched once
+        cached_at = getattr(cached_data, 'cached_at_epoch', None)
+        if cached_at is None:
+            logger.debug("Cache data has no write timestamp, considering stale")
             return False
+
+        age_seconds = datetime.now().timestamp() - cached_at
+        is_fresh = age_seconds < max_age_minutes * 60
+        logger.debug("Cache age: {:.1f} minutes, fresh: {}", age_seconds / 60, is_fresh)
+        return is_fresh
     
     async def _test_data_sources(self):
-        """Test connectivity to all data sources."""
+        """Test connectivity to all data sources concurrently."""
         logger.info("🧪 Testing data source connectivity...")
-        
-        for source_name, source in self.data_sources.items():
-            try:
-                logger.info(f"🔍 Testing {source_name}...")
-                
-                # Get the test symbol this source will use
-                test_symbol = getattr(source, '_get_health_check_symbol', lambda: 'SPY')()
-                logger.info(f"🔍 {source_name} will test with symbol: {test_symbol}")
-                
-                # Check if this source is appropriate for the test symbol
-                if hasattr(self, '_is_source_appropriate_for_symbol'):
-                    is_appropriate = self._is_source_appropriate_for_symbol(source_name, test_symbol)
-                    if not is_appropriate:
-                        logger.warning(f"⚠️  {source_name} is not appropriate for testing with {test_symbol}, skipping health check")
-                        continue
-                
-                test_result = await source.health_check()
-                if test_result:
-                    logger.info(f"✅ {source_name} is available and healthy")
-                else:
-                    logger.warning(f"⚠️  {source_name} health check failed, but continuing service startup")
-            except Exception as e:
-                logger.error(f"❌ {source_name} connectivity test failed: {type(e).__name__}: {e}")
-                logger.warning(f"⚠️  {source_name} failed, but continuing service startup to avoid crash")
+
+        # The health checks are independent HTTP calls; racing them in one
+        # gather turns startup cost from the sum of source latencies into
+        # the slowest single check
+        await asyncio.gather(
+            *(self._test_one_source(name, source) for name, source in self.data_sources.items()),
+            return_exceptions=True
+        )
+
+    async def _test_one_source(self, source_name: str, source) -> None:
+        """Run the connectivity test for a single data source."""
+        try:
+            logger.info(f"🔍 Testing {source_name}...")
+
+            # Get the test symbol this source will use
+            test_symbol = source._get_health_check_symbol()
+            logger.info(f"🔍 {source_name} will test with symbol: {test_symbol}")
+
+            # Check if this source is appropriate for the test symbol
+            if not self._is_source_appropriate_for_symbol(source_name, test_symbol):
+                logger.warning(f"⚠️  {source_name} is not appropriate for testing with {test_symbol}, skipping health check")
+                return
+
+            test_result = await source.health_check()
+            if test_result:
+                logger.info(f"✅ {source_name} is available and healthy")
+            else:
+                logger.warning(f"⚠️  {source_name} health check failed, but continuing service startup")
+        except Exception as e:
+            logger.error(f"❌ {source_name} connectivity test failed: {type(e).__name__}: {e}")
+            logger.warning(f"⚠️  {source_name} failed, but continuing service startup to avoid crash")
     
     async def get_stats(self) -> Dict:
         """Get ingestion statistics."""
@@ -923,7 +1012,7 @@ class PriceIngester:
         
         try:
             # Check if symbol is in our tracked list
-            if symbol not in self.symbols:
+            if symbol not in self._symbols_set:
                 raise ValueError(f"Symbol {symbol} is not in tracked symbols: {self.symbols}")
             
             # Process the single symbol
@@ -933,8 +1022,13 @@ class PriceIngester:
                 'symbols_failed': 0,
                 'sources_used': {},
                 'errors': []
-            })
-            
+            }, self._is_market_hours())
+
+            # This path has no end-of-cycle flush (the scheduler's crypto
+            # job calls it per symbol), so write the buffered rows out now
+            if not await self._flush_pending_prices():
+                raise IngestionError(f"Failed to store buffered price for {symbol}")
+
             results['success'] = True
             logger.info(f"✅ Successfully ingested {symbol}")
             
@@ -965,33 +1059,32 @@ class PriceIngester:
                 return False
             
             logger.info(f"🔍 Fetching historical data from Alpha Vantage for {symbol}...")
-            historical_data = await alpha_vantage.get_historical_data(symbol, days)
+            # The scheduler fans this out HISTORICAL_CONCURRENCY wide, so
+            # the per-source token bucket is what keeps the concurrent
+            # fetches inside Alpha Vantage's rate limit
+            limiter = self._limiters.get(alpha_vantage.name)
+            if limiter:
+                async with limiter:
+                    historical_data = await alpha_vantage.get_historical_data(symbol, days)
+            else:
+                historical_data = await alpha_vantage.get_historical_data(symbol, days)
             if not historical_data:
                 logger.error(f"❌ No historical data returned for {symbol}")
                 return False
             
             logger.info(f"📊 Retrieved {len(historical_data)} historical data points for {symbol}")
             
-            # Store historical data
-            stored_count = 0
-            failed_count = 0
-            
-            for i, price_data in enumerate(historical_data):
-                try:
-                    logger.debug(f"💾 Storing historical data point {i+1}/{len(historical_data)} for {symbol}")
-                    store_success = await self.db_manager.store_price(price_data)
-                    if store_success:
-                        stored_count += 1
-                        logger.debug(f"✅ Stored historical data point {i+1} for {symbol}")
-                    else:
-                        failed_count += 1
-                        logger.warning(f"⚠️  Failed to store historical data point {i+1} for {symbol}")
-                except Exception as e:
-                    failed_count += 1
-                    logger.error(f"💥 Error storing historical data point {i+1} for {symbol}: {e}")
-            
-            logger.info(f"📊 Historical data ingestion for {symbol} completed: {stored_count} stored, {failed_count} failed")
-            return stored_count > 0
+            # COPY only pays off when the range is genuinely empty; the
+            # routine refresh overlaps existing rows, which would trip the
+            # unique-violation fallback and process the batch twice
+            if await self.db_manager.needs_historical_population(symbol):
+                storage_result = await self.db_manager.copy_prices(historical_data)
+            else:
+                storage_result = await self.db_manager.store_prices_bulk(historical_data)
+            stored_count = storage_result['stored']
+
+            logger.info(f"📊 Historical data ingestion for {symbol} completed: {stored_count} stored")
+            return storage_result['success'] and stored_count > 0
             
         except Exception as e:
             logger.error(f"💥 Failed to ingest historical data for {symbol}: {type(e).__name__}: {e}")
@@ -1016,7 +1109,10 @@ class PriceIngester:
                         logger.info(f"✅ {source_name} data source closed")
                     except Exception as e:
                         logger.warning(f"⚠️  Error closing {source_name}: {e}")
-            
+
+            # Sessions share one connection pool; release it last
+            await close_shared_connector()
+
             logger.info("✅ Price ingester closed successfully")
             
         except Exception as e:
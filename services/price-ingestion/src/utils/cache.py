@@ -2,17 +2,76 @@
 Redis cache management for the price ingestion service.
 """
 
+import asyncio
+import functools
 import json
+import time
 import redis.asyncio as redis
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
+
 from .config import config
 from .logger import logger
 from ..database.models import PriceData
 from ..exceptions import CacheError
 
 
+# Atomic check-and-count rate limiter: INCR the per-minute counter, start
+# its 60s window on first use, and report whether the limit is exceeded -
+# one round-trip, no GET/SETEX race
+_RATE_LIMIT_LUA = """
+local c = redis.call('INCR', KEYS[1])
+if c == 1 then
+    redis.call('EXPIRE', KEYS[1], 60)
+end
+if c > tonumber(ARGV[1]) then
+    return 0
+end
+return 1
+"""
+
+
+def _dumps(obj) -> str:
+    """Serialize a cache payload (orjson when available, ~2-10x faster)."""
+    if orjson is not None:
+        # Datetimes serialize natively in C; numpy scalars (from
+        # yfinance/pandas payloads) are handled without a Python hook.
+        # default=str still covers Decimal and other stragglers.
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY,
+            default=str
+        ).decode('utf-8')
+    return json.dumps(obj, default=str)
+
+
+def _loads(data):
+    """Deserialize a cache payload."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_cached_price(raw: bytes) -> PriceData:
+    """
+    Parse a raw latest-price payload into a PriceData object (memoized).
+
+    Keyed on the raw bytes, so re-reading the same unchanged value within
+    a cycle (MGET prefetch plus the SWR read) parses once. The write epoch
+    travels on the object as cached_at_epoch for freshness checks.
+    """
+    data = _loads(raw)
+    price_data = PriceData.from_dict(data)
+    price_data.cached_at_epoch = data.get('_cached_at_epoch')
+    return price_data
+
+
 class CacheManager:
     """
     Manages Redis cache for price data and rate limiting.
@@ -26,16 +85,24 @@ class CacheManager:
             'cache_sets': 0,
             'cache_errors': 0
         }
+        # (fetched_at_monotonic, info_dict) - INFO replies are large, so
+        # a polled /stats endpoint reuses one for a few seconds
+        self._info_cache = (0.0, None)
+        self._rate_limit_script = None
+        # Strong references to in-flight SWR refresh tasks; a bare
+        # create_task can be garbage-collected mid-refresh
+        self._refresh_tasks: set = set()
     
     async def initialize(self):
         """Initialize Redis connection."""
         try:
             logger.info("Initializing Redis cache connection...")
             
+            # Raw bytes path: replies stay undecoded (orjson parses bytes
+            # directly) and redis-py picks up the hiredis C parser when
+            # it is installed
             self.redis_client = redis.from_url(
                 config.redis_url,
-                encoding='utf-8',
-                decode_responses=True,
                 socket_timeout=5,
                 socket_connect_timeout=5,
                 retry_on_timeout=True,
@@ -44,39 +111,75 @@ class CacheManager:
             
             # Test connection
             await self.redis_client.ping()
-            
+
+            # Register the rate-limit script once; redis-py re-sends the
+            # source transparently if the server loses it
+            self._rate_limit_script = self.redis_client.register_script(_RATE_LIMIT_LUA)
+
             logger.info("Redis cache connection established successfully")
             
         except Exception as e:
             logger.error(f"Failed to initialize Redis cache: {e}")
             raise CacheError(f"Cache initialization failed: {e}")
     
-    async def get_price(self, symbol: str) -> Optional[Dict]:
+    async def get_price(self, symbol: str) -> Optional[PriceData]:
         """
         Get cached price data for a symbol.
-        
+
         Args:
             symbol: Stock symbol
-            
+
         Returns:
-            Dictionary with price data if cached, None otherwise
+            PriceData object if cached, None otherwise
         """
         try:
             key = f"price:{symbol.upper()}:latest"
             cached_data = await self.redis_client.get(key)
-            
+
             if cached_data:
                 self.stats['cache_hits'] += 1
-                return json.loads(cached_data)
+                return _parse_cached_price(cached_data)
             else:
                 self.stats['cache_misses'] += 1
                 return None
-                
+
         except Exception as e:
             self.stats['cache_errors'] += 1
             logger.warning(f"Cache get error for {symbol}: {e}")
             return None
-    
+
+    async def get_prices(self, symbols: list) -> Dict[str, Optional[PriceData]]:
+        """
+        Get cached price data for multiple symbols in a single round-trip.
+
+        Args:
+            symbols: List of stock symbols
+
+        Returns:
+            Dictionary mapping each symbol to its cached PriceData (or None)
+        """
+        if not symbols:
+            return {}
+
+        try:
+            keys = [f"price:{s.upper()}:latest" for s in symbols]
+            cached_values = await self.redis_client.mget(keys)
+
+            results = {}
+            for symbol, cached_data in zip(symbols, cached_values):
+                if cached_data:
+                    self.stats['cache_hits'] += 1
+                    results[symbol] = _parse_cached_price(cached_data)
+                else:
+                    self.stats['cache_misses'] += 1
+                    results[symbol] = None
+            return results
+
+        except Exception as e:
+            self.stats['cache_errors'] += 1
+            logger.warning(f"Bulk cache get error for {len(symbols)} symbols: {e}")
+            return {symbol: None for symbol in symbols}
+
     async def set_price(self, symbol: str, price_data: PriceData, ttl_seconds: int = 900):
         """
         Cache price data for a symbol.
@@ -89,11 +192,14 @@ class CacheManager:
         try:
             key = f"price:{symbol.upper()}:latest"
             data = price_data.to_dict()
-            
+            # Numeric write timestamp so freshness checks are a float
+            # compare instead of an ISO-8601 parse on every hit
+            data['_cached_at_epoch'] = time.time()
+
             await self.redis_client.setex(
                 key,
                 ttl_seconds,
-                json.dumps(data, default=str)
+                _dumps(data)
             )
             
             self.stats['cache_sets'] += 1
@@ -103,6 +209,125 @@ class CacheManager:
             self.stats['cache_errors'] += 1
             logger.warning(f"Cache set error for {symbol}: {e}")
     
+    async def get_or_set_swr(self, symbol: str, factory, ttl_seconds: int = 900,
+                             stale_ttl_seconds: int = 900) -> Optional[PriceData]:
+        """
+        Stale-while-revalidate read-through for a symbol's latest price.
+
+        A fresh value is returned directly. A stale-but-present value is
+        returned immediately while a single background task refreshes it,
+        so callers never stampede the upstream APIs on expiry. Only a true
+        miss awaits the factory inline.
+
+        Args:
+            symbol: Stock symbol
+            factory: Zero-argument coroutine function producing a PriceData
+            ttl_seconds: How long a value counts as fresh
+            stale_ttl_seconds: Additional window during which a stale value
+                may still be served while a refresh runs
+
+        Returns:
+            PriceData object, or None if no value could be obtained
+        """
+        key = f"price:{symbol.upper()}:latest"
+        fresh_key = f"price:{symbol.upper()}:fresh_until"
+
+        try:
+            value, fresh_until = await self.redis_client.mget([key, fresh_key])
+        except Exception as e:
+            self.stats['cache_errors'] += 1
+            logger.warning(f"SWR cache read error for {symbol}: {e}")
+            value, fresh_until = None, None
+
+        if value is not None:
+            self.stats['cache_hits'] += 1
+            if fresh_until and datetime.now().timestamp() < float(fresh_until):
+                return _parse_cached_price(value)
+
+            # Serve stale immediately; one background task revalidates.
+            # Held in _refresh_tasks (same pattern as the scheduler's
+            # _spawn) so it can't be collected mid-refresh
+            task = asyncio.create_task(
+                self._background_refresh(symbol, factory, ttl_seconds, stale_ttl_seconds)
+            )
+            self._refresh_tasks.add(task)
+            task.add_done_callback(self._refresh_tasks.discard)
+            logger.debug(f"Serving stale price for {symbol}, refresh scheduled")
+            return _parse_cached_price(value)
+
+        self.stats['cache_misses'] += 1
+        price_data = await factory()
+        if price_data is not None:
+            await self._store_swr(symbol, price_data, ttl_seconds, stale_ttl_seconds)
+        return price_data
+
+    async def _store_swr(self, symbol: str, price_data: PriceData,
+                         ttl_seconds: int, stale_ttl_seconds: int):
+        """Write a value plus its freshness deadline in one pipeline."""
+        try:
+            key = f"price:{symbol.upper()}:latest"
+            fresh_key = f"price:{symbol.upper()}:fresh_until"
+            total_ttl = ttl_seconds + stale_ttl_seconds
+
+            data = price_data.to_dict()
+            data['_cached_at_epoch'] = time.time()
+
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.set(key, _dumps(data), ex=total_ttl)
+                pipe.set(fresh_key, datetime.now().timestamp() + ttl_seconds, ex=total_ttl)
+                await pipe.execute()
+
+            self.stats['cache_sets'] += 1
+
+        except Exception as e:
+            self.stats['cache_errors'] += 1
+            logger.warning(f"SWR cache set error for {symbol}: {e}")
+
+    async def _background_refresh(self, symbol: str, factory, ttl_seconds: int,
+                                  stale_ttl_seconds: int):
+        """Refresh one symbol, guarded so only a single refresher fires."""
+        lock_key = f"refresh:{symbol.upper()}"
+        if not await self.get_ingestion_lock(lock_key, ttl_seconds=60):
+            return  # another worker is already refreshing this key
+
+        try:
+            price_data = await factory()
+            if price_data is not None:
+                await self._store_swr(symbol, price_data, ttl_seconds, stale_ttl_seconds)
+                logger.debug(f"Background refresh completed for {symbol}")
+        except Exception as e:
+            logger.warning(f"Background refresh failed for {symbol}: {e}")
+        finally:
+            await self.release_ingestion_lock(lock_key)
+
+    async def set_prices_bulk(self, entries: list, ttl_seconds: int = 900):
+        """
+        Cache price data for multiple symbols in one pipelined round-trip.
+
+        Args:
+            entries: List of (symbol, PriceData) tuples
+            ttl_seconds: Time to live in seconds (default: 15 minutes)
+        """
+        if not entries:
+            return
+
+        try:
+            cached_at = time.time()
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for symbol, price_data in entries:
+                    key = f"price:{symbol.upper()}:latest"
+                    data = price_data.to_dict() if hasattr(price_data, 'to_dict') else dict(price_data)
+                    data['_cached_at_epoch'] = cached_at
+                    pipe.set(key, _dumps(data), ex=ttl_seconds)
+                await pipe.execute()
+
+            self.stats['cache_sets'] += len(entries)
+            logger.debug(f"Cached prices for {len(entries)} symbols in one pipeline (TTL: {ttl_seconds}s)")
+
+        except Exception as e:
+            self.stats['cache_errors'] += 1
+            logger.warning(f"Bulk cache set error for {len(entries)} symbols: {e}")
+
     async def get_historical_prices(self, symbol: str, days: int = 30) -> Optional[Dict]:
         """Get cached historical price data."""
         try:
@@ -111,7 +336,7 @@ class CacheManager:
             
             if cached_data:
                 self.stats['cache_hits'] += 1
-                return json.loads(cached_data)
+                return _loads(cached_data)
             else:
                 self.stats['cache_misses'] += 1
                 return None
@@ -132,7 +357,7 @@ class CacheManager:
             await self.redis_client.setex(
                 key,
                 ttl_seconds,
-                json.dumps(data, default=str)
+                _dumps(data)
             )
             
             self.stats['cache_sets'] += 1
@@ -142,10 +367,54 @@ class CacheManager:
             self.stats['cache_errors'] += 1
             logger.warning(f"Historical cache set error for {symbol}: {e}")
     
+    async def invalidate_symbol(self, symbol: str) -> int:
+        """
+        Invalidate all cached entries for a symbol.
+
+        Uses SCAN + UNLINK so Redis is never blocked by a full keyspace
+        sweep and the actual deallocation happens on a background thread.
+
+        Args:
+            symbol: Stock symbol to invalidate
+
+        Returns:
+            Number of cache entries removed
+        """
+        patterns = [
+            f"price:{symbol.upper()}:*",           # Current prices
+            f"historical:{symbol.upper()}:*",      # Historical data
+            f"crypto:{symbol.upper()}:*"           # Crypto data
+        ]
+
+        total_cleared = 0
+        try:
+            for pattern in patterns:
+                buffer = []
+                async for key in self.redis_client.scan_iter(match=pattern, count=500):
+                    buffer.append(key)
+                    if len(buffer) >= 1000:
+                        total_cleared += await self.redis_client.unlink(*buffer)
+                        buffer = []
+                if buffer:
+                    total_cleared += await self.redis_client.unlink(*buffer)
+
+            if total_cleared > 0:
+                logger.debug(f"Invalidated {total_cleared} cache entries for {symbol}")
+            return total_cleared
+
+        except Exception as e:
+            self.stats['cache_errors'] += 1
+            logger.warning(f"Cache invalidation error for {symbol}: {e}")
+            return total_cleared
+
     async def check_rate_limit(self, source: str, limit_per_minute: int) -> bool:
         """
         Check if a data source is within rate limits.
-        
+
+        The check also counts as one request - a True return means the
+        request has been recorded against this minute's window.
+
+
         Args:
             source: Data source name (e.g., 'finnhub', 'yahoo')
             limit_per_minute: Maximum requests per minute
@@ -155,41 +424,16 @@ class CacheManager:
         """
         try:
             key = f"rate_limit:{source}:minute"
-            current_count = await self.redis_client.get(key)
-            
-            if current_count is None:
-                # First request in this minute
-                await self.redis_client.setex(key, 60, 1)
-                return True
-            elif int(current_count) < limit_per_minute:
-                # Within limits, increment counter
-                await self.redis_client.incr(key)
-                return True
-            else:
-                # Rate limited
-                return False
-                
+            # One atomic EVALSHA both counts this request and answers the
+            # check, replacing the racy GET-then-SETEX/INCR pair
+            allowed = await self._rate_limit_script(keys=[key], args=[limit_per_minute])
+            return bool(int(allowed))
+
         except Exception as e:
             logger.warning(f"Rate limit check error for {source}: {e}")
             # On error, allow the request (fail open)
             return True
-    
-    async def record_rate_limit_usage(self, source: str):
-        """Record that a rate limited API was used."""
-        try:
-            key = f"rate_limit:{source}:minute"
-            
-            # Get current count or start at 0
-            current_count = await self.redis_client.get(key)
-            
-            if current_count is None:
-                await self.redis_client.setex(key, 60, 1)
-            else:
-                await self.redis_client.incr(key)
-                
-        except Exception as e:
-            logger.warning(f"Rate limit recording error for {source}: {e}")
-    
+
     async def get_ingestion_lock(self, lock_key: str, ttl_seconds: int = 300) -> bool:
         """
         Acquire a distributed lock for ingestion operations.
@@ -225,9 +469,15 @@ class CacheManager:
             return {'status': 'disconnected'}
         
         try:
-            # Get Redis info
-            info = await self.redis_client.info()
-            
+            # Get Redis info, reusing a recent reply if one exists so a
+            # dashboard polling /stats doesn't serialize the full INFO
+            # payload on every request
+            fetched_at, info = self._info_cache
+            now = time.monotonic()
+            if info is None or now - fetched_at >= 5:
+                info = await self.redis_client.info()
+                self._info_cache = (now, info)
+
             return {
                 'status': 'connected',
                 'redis_version': info.get('redis_version'),
@@ -246,18 +496,35 @@ class CacheManager:
             }
     
     async def clear_cache(self, pattern: str = "price:*"):
-        """Clear cached data matching pattern."""
+        """
+        Clear cached data matching pattern.
+
+        Iterates with SCAN and frees keys via UNLINK, so a clear never
+        blocks Redis the way KEYS + DELETE would on a large keyspace.
+        """
         try:
-            keys = await self.redis_client.keys(pattern)
-            if keys:
-                await self.redis_client.delete(*keys)
-                logger.info(f"Cleared {len(keys)} cache entries matching '{pattern}'")
-            
+            cleared = 0
+            batch = []
+            async for key in self.redis_client.scan_iter(match=pattern, count=500):
+                batch.append(key)
+                if len(batch) >= 500:
+                    cleared += await self.redis_client.unlink(*batch)
+                    batch.clear()
+            if batch:
+                cleared += await self.redis_client.unlink(*batch)
+
+            if cleared:
+                logger.info(f"Cleared {cleared} cache entries matching '{pattern}'")
+
         except Exception as e:
             logger.error(f"Cache clear error: {e}")
     
     async def close(self):
         """Close Redis connection."""
+        # Let in-flight refreshes finish (they release their lock keys)
+        # before the connection goes away
+        if self._refresh_tasks:
+            await asyncio.gather(*self._refresh_tasks, return_exceptions=True)
         if self.redis_client:
             await self.redis_client.close()
             self.redis_client = None
@@ -3,7 +3,7 @@ Configuration management for the price ingestion service.
 """
 
 import os
-from typing import List
+from typing import Tuple, FrozenSet
 from dataclasses import dataclass, field
 
 
@@ -37,9 +37,14 @@ class Config:
     LOG_FORMAT: str = os.getenv('LOG_FORMAT', 'json')
     
     # Ingestion Configuration
-    TRACKED_SYMBOLS: List[str] = field(default_factory=lambda: os.getenv('TRACKED_SYMBOLS', 'SPY,QQQ,IWM,BTC/USD').split(','))
+    # Parsed from the env as a list, frozen to a tuple (plus a frozenset
+    # companion for membership tests) in __post_init__
+    TRACKED_SYMBOLS: Tuple[str, ...] = field(default_factory=lambda: os.getenv('TRACKED_SYMBOLS', 'SPY,QQQ,IWM,BTC/USD').split(','))
+    TRACKED_SYMBOLS_SET: FrozenSet[str] = field(init=False, default=frozenset())
     REALTIME_INTERVAL: int = int(os.getenv('REALTIME_INTERVAL', '1'))  # minutes
     DAILY_INTERVAL: int = int(os.getenv('DAILY_INTERVAL', '60'))  # minutes
+    CRYPTO_CONCURRENCY: int = int(os.getenv('CRYPTO_CONCURRENCY', '4'))
+    HISTORICAL_CONCURRENCY: int = int(os.getenv('HISTORICAL_CONCURRENCY', '3'))
     
     # Market Hours (UTC/GMT for NASDAQ)
     MARKET_OPEN_HOUR: int = int(os.getenv('MARKET_OPEN_HOUR', '14'))  # 2:30 PM UTC
@@ -63,9 +68,11 @@ class Config:
     
     def __post_init__(self):
         """Validate configuration after initialization."""
-        # Clean up tracked symbols
-        self.TRACKED_SYMBOLS = [s.strip().upper() for s in self.TRACKED_SYMBOLS if s.strip()]
-        
+        # Clean up tracked symbols: a tuple for ordered iteration plus a
+        # frozenset for O(1) membership checks, both immutable
+        self.TRACKED_SYMBOLS = tuple(s.strip().upper() for s in self.TRACKED_SYMBOLS if s.strip())
+        self.TRACKED_SYMBOLS_SET = frozenset(self.TRACKED_SYMBOLS)
+
         # Validate required API keys for production
         if self.ENVIRONMENT == 'production':
             if not self.FINNHUB_API_KEY:
@@ -2,25 +2,45 @@
 Logging configuration for the price ingestion service.
 """
 
+import atexit
 import sys
 import logging
 from loguru import logger as loguru_logger
 from .config import config
 
+# Guards against re-running setup on module reimport (pytest, reloaders),
+# which would leak file handles and duplicate every record
+_INITIALIZED = False
+
+# Cached for the frame-walk below to skip the module attribute lookup per
+# frame (co_filename comes from cached bytecode, so identity isn't reliable)
+_LOGGING_FILE = logging.__file__
+
+# Stdlib level names map to a fixed set of loguru levels, so resolve them
+# once instead of a try/except loguru lookup per intercepted record
+_LEVEL_CACHE = {
+    name: loguru_logger.level(name).name
+    for name in ("TRACE", "DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL")
+}
+_LEVEL_CACHE["WARN"] = "WARNING"
+_LEVEL_CACHE["FATAL"] = "CRITICAL"
+
 
 class InterceptHandler(logging.Handler):
     """Intercept standard logging and redirect to loguru."""
-    
+
     def emit(self, record):
         # Get corresponding Loguru level if it exists
+        level = _LEVEL_CACHE.get(record.levelname) or record.levelno
+
+        # Find caller from where originated the logged message. The stdlib
+        # logging stack has a fixed shape on CPython, so jump straight to the
+        # expected caller frame and only walk if wrapper frames are present
         try:
-            level = loguru_logger.level(record.levelname).name
+            frame, depth = sys._getframe(6), 6
         except ValueError:
-            level = record.levelno
-
-        # Find caller from where originated the logged message
-        frame, depth = logging.currentframe(), 2
-        while frame.f_code.co_filename == logging.__file__:
+            frame, depth = logging.currentframe(), 2
+        while frame and frame.f_code.co_filename == _LOGGING_FILE:
             frame = frame.f_back
             depth += 1
 
@@ -30,7 +50,12 @@ class InterceptHandler(logging.Handler):
 
 
 def setup_logging():
-    """Configure logging for the application."""
+    """Configure logging for the application. Safe to call more than once."""
+    global _INITIALIZED
+    if _INITIALIZED:
+        return
+    _INITIALIZED = True
+
     # Remove default loguru handler
     loguru_logger.remove()
     
@@ -63,10 +88,14 @@ def setup_logging():
         format=format_string,
         level=config.LOG_LEVEL,
         colorize=config.LOG_FORMAT != 'json',
-        serialize=config.LOG_FORMAT == 'json'
+        serialize=config.LOG_FORMAT == 'json',
+        backtrace=False,
+        diagnose=False
     )
     
-    # Add file handler for persistent logs
+    # Add file handler for persistent logs. enqueue=True hands records to a
+    # dedicated writer thread so the event loop never blocks on disk writes;
+    # catch=True keeps the writer alive if a record fails to serialize.
     log_file = "logs/price-ingestion.log"
     loguru_logger.add(
         log_file,
@@ -75,9 +104,13 @@ def setup_logging():
         compression="gz",
         format=format_string,
         level=config.LOG_LEVEL,
-        serialize=config.LOG_FORMAT == 'json'
+        serialize=config.LOG_FORMAT == 'json',
+        enqueue=True,
+        catch=True,
+        backtrace=False,
+        diagnose=False
     )
-    
+
     # Add error log file for errors only
     error_log_file = "logs/price-ingestion-error.log"
     loguru_logger.add(
@@ -87,7 +120,13 @@ def setup_logging():
         compression="gz",
         format=format_string,
         level="ERROR",
-        serialize=config.LOG_FORMAT == 'json'
+        serialize=config.LOG_FORMAT == 'json',
+        enqueue=True,
+        catch=True,
+        # Keep extended tracebacks for errors, but never variable values -
+        # diagnose would leak credentials into the log file
+        backtrace=True,
+        diagnose=False
     )
     
     # Intercept standard library logging
@@ -104,16 +143,21 @@ def setup_logging():
     logging.getLogger("asyncpg.connection").setLevel(logging.INFO)
     logging.getLogger("aiohttp.client").setLevel(logging.INFO)
 
+    # Drain the enqueue=True writer threads on interpreter exit
+    atexit.register(loguru_logger.remove)
+
+
+def log_startup_banner():
+    """Log the logging-configuration banner. Called by the app entrypoint."""
+    loguru_logger.info("🔧 Logging configuration setup completed")
+    loguru_logger.info(f"📝 Log format: {config.LOG_FORMAT}")
+    loguru_logger.info(f"📊 Log level: {config.LOG_LEVEL}")
+    loguru_logger.info(f"🌍 Environment: {config.ENVIRONMENT}")
+    loguru_logger.info("✅ Logging system ready")
+
 
 # Initialize logging first
 setup_logging()
 
-# Now we can use the logger to log setup completion
-loguru_logger.info("🔧 Logging configuration setup completed")
-loguru_logger.info(f"📝 Log format: {config.LOG_FORMAT}")
-loguru_logger.info(f"📊 Log level: {config.LOG_LEVEL}")
-loguru_logger.info(f"🌍 Environment: {config.ENVIRONMENT}")
-loguru_logger.info("✅ Logging system ready")
-
 # Export the configured logger
 logger = loguru_logger
\ No newline at end of file
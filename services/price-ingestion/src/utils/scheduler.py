@@ -3,13 +3,16 @@ Scheduling utilities for the price ingestion service.
 """
 
 import asyncio
-import schedule
-from datetime import datetime, time
+import heapq
+import itertools
+from datetime import datetime, time, timedelta, timezone
+# Imported this way because "time" above is datetime.time
+from time import monotonic
 from typing import Callable, Optional
-import pytz
 
 from .config import config
 from .logger import logger
+from .symbols import is_crypto_symbol
 
 
 class PriceScheduler:
@@ -21,7 +24,35 @@ class PriceScheduler:
         self.ingester = ingester
         self.running = False
         self.scheduler_task: Optional[asyncio.Task] = None
-        self.timezone = pytz.timezone('UTC')  # Market timezone (NASDAQ in UTC)
+        # Market timezone (NASDAQ in UTC); the stdlib singleton has
+        # C-accelerated arithmetic, unlike pytz's Python utcoffset path
+        self.timezone = timezone.utc
+        self.timezone_name = str(self.timezone)
+        # Market-hour bounds never change at runtime, so build them once
+        self._market_open = time(config.MARKET_OPEN_HOUR, config.MARKET_OPEN_MINUTE)
+        self._market_close = time(config.MARKET_CLOSE_HOUR, config.MARKET_CLOSE_MINUTE)
+        # Due times live in a heap of (next_run_monotonic, seq, job_name);
+        # job definitions (callback, cadence, wall-clock next run) are kept
+        # alongside so the loop sleeps exactly until the nearest job is due
+        self._jobs_heap: list = []
+        self._job_defs: dict = {}
+        self._job_seq = itertools.count()
+        # Set to interrupt the sleeping loop when the job set changes
+        self._wake_event = asyncio.Event()
+        # get_schedule_info's per-job dicts, rebuilt only after a job mutates
+        self._schedule_info_cache = None
+        # Fire-and-forget job runs are tracked so stop() can await them;
+        # per-category locks keep a slow run from overlapping the next one
+        self._inflight: set = set()
+        self._ingest_lock = asyncio.Lock()
+        self._crypto_lock = asyncio.Lock()
+        self._historical_lock = asyncio.Lock()
+        self._maintenance_lock = asyncio.Lock()
+        # Crypto subset of the ingester's symbols, kept current by add_symbol
+        # so the per-tick filter is a set lookup
+        self._crypto_symbols = {s for s in ingester.symbols if self._is_crypto_symbol(s)}
+        # Bounds how many symbols a crypto tick ingests at once
+        self._crypto_sem = asyncio.Semaphore(config.CRYPTO_CONCURRENCY)
         logger.info("PriceScheduler initialized")
         logger.info(f"🌍 Using timezone: {self.timezone}")
     
@@ -32,7 +63,8 @@ class PriceScheduler:
         try:
             # Clear any existing jobs
             logger.debug("🧹 Clearing existing scheduled jobs...")
-            schedule.clear()
+            self._jobs_heap.clear()
+            self._job_defs.clear()
             logger.debug("✅ Existing jobs cleared")
             
             # Schedule real-time ingestion during market hours
@@ -58,7 +90,8 @@ class PriceScheduler:
         """Stop the scheduler."""
         logger.info("🛑 Stopping price ingestion scheduler...")
         self.running = False
-        
+        self._wake_event.set()
+
         if self.scheduler_task and not self.scheduler_task.done():
             logger.debug("🔄 Cancelling scheduler task...")
             self.scheduler_task.cancel()
@@ -70,8 +103,15 @@ class PriceScheduler:
             except Exception as e:
                 logger.warning(f"⚠️  Error while cancelling scheduler task: {e}")
         
+        if self._inflight:
+            logger.info(f"⏳ Waiting for {len(self._inflight)} in-flight job(s) to finish...")
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
         logger.debug("🧹 Clearing scheduled jobs...")
-        schedule.clear()
+        self._jobs_heap.clear()
+        self._job_defs.clear()
+        self._schedule_info_cache = None
+        self._wake_event.clear()
         logger.info("✅ Price ingestion scheduler stopped")
     
     def _schedule_market_hours_ingestion(self):
@@ -82,23 +122,24 @@ class PriceScheduler:
         # This is a simplified approach - in production you'd want more sophisticated scheduling
         
         # NASDAQ market hours: 2:30 PM to 9:00 PM UTC
-        market_start = time(config.MARKET_OPEN_HOUR, config.MARKET_OPEN_MINUTE)
-        market_end = time(config.MARKET_CLOSE_HOUR, config.MARKET_CLOSE_MINUTE)
-        
-        logger.info(f"⏰ NASDAQ market hours: {market_start.strftime('%H:%M')} - {market_end.strftime('%H:%M')} UTC")
+        logger.info(f"⏰ NASDAQ market hours: {self._market_open.strftime('%H:%M')} - {self._market_close.strftime('%H:%M')} UTC")
         logger.info(f"🔄 Stock ingestion interval: every {interval} minutes (during market hours only)")
         logger.info(f"🪙 Crypto ingestion interval: every {interval} minutes (24/7)")
         
-        # Schedule every X minutes during market hours
-        schedule.every(interval).minutes.do(self._run_market_hours_ingestion)
-        
+        # Schedule every X minutes while the market is open; when closed the
+        # job parks itself until the next open instead of ticking all night
+        self._add_job('market_hours_ingestion', self._run_market_hours_ingestion,
+                      interval_seconds=interval * 60,
+                      delay_fn=self._market_tick_delay)
+
         # Schedule 24/7 cryptocurrency ingestion (using REALTIME_INTERVAL)
         logger.info(f"🪙 Scheduling 24/7 cryptocurrency ingestion every {interval} minute...")
-        schedule.every(interval).minutes.do(self._run_crypto_ingestion)
-        
+        self._add_job('crypto_ingestion', self._run_crypto_ingestion,
+                      interval_seconds=interval * 60)
+
         logger.info(f"✅ Scheduled market hours ingestion every {interval} minutes")
         logger.info(f"✅ Scheduled 24/7 crypto ingestion every {interval} minute")
-        logger.info(f"📋 Next scheduled run: {schedule.next_run()}")
+        logger.info(f"📋 Next scheduled run: {self._next_run_wall()}")
     
     async def add_symbol(self, symbol: str):
         """
@@ -114,253 +155,380 @@ class PriceScheduler:
             is_crypto = self._is_crypto_symbol(symbol)
             
             if is_crypto:
+                self._crypto_symbols.add(symbol)
                 logger.info(f"🪙 {symbol} is a cryptocurrency, will be included in 24/7 ingestion")
             else:
                 logger.info(f"📊 {symbol} is a stock, will be included in market hours ingestion")
             
             # The symbol will automatically be included in the next scheduled run
             # since the ingester.symbols list is used in the ingestion methods
+            self._wake_event.set()
             logger.info(f"✅ {symbol} added to scheduler successfully")
             
         except Exception as e:
             logger.error(f"❌ Failed to add {symbol} to scheduler: {type(e).__name__}: {e}")
     
-    def _is_crypto_symbol(self, symbol: str) -> bool:
-        """Check if a symbol is a cryptocurrency."""
-        # Check for common cryptocurrency symbols
-        crypto_symbols = ['BTC', 'ETH', 'ADA', 'DOT', 'LINK', 'LTC', 'BCH', 'XRP', 'XLM', 'EOS']
-        
-        # Check for slash notation (e.g., BTC/USD)
-        if '/' in symbol:
-            base = symbol.split('/')[0].upper()
-            return base in crypto_symbols
-        
-        # Check for dash notation (e.g., BTC-USD)
-        if '-' in symbol:
-            base = symbol.split('-')[0].upper()
-            return base in crypto_symbols
-        
-        # Check if the symbol itself is a known crypto
-        clean_symbol = symbol.upper().replace('USD', '').replace('USDT', '')
-        return clean_symbol in crypto_symbols
-    
+    # Shared classifier so the scheduler, ingester and database layer
+    # always agree on which symbols belong to the crypto job
+    _is_crypto_symbol = staticmethod(is_crypto_symbol)
+
     def _schedule_daily_tasks(self):
         """Schedule daily maintenance tasks."""
         logger.info("📅 Setting up daily scheduled tasks...")
         
         # Schedule historical data updates after market close
         historical_time = "17:00"
-        schedule.every().day.at(historical_time).do(self._run_daily_historical_update)
+        self._add_job('daily_historical_update', self._run_daily_historical_update,
+                      daily_at=historical_time)
         logger.info(f"✅ Scheduled daily historical update at {historical_time}")
-        
+
         # Schedule database maintenance at night
         maintenance_time = "02:00"
-        schedule.every().day.at(maintenance_time).do(self._run_daily_maintenance)
+        self._add_job('daily_maintenance', self._run_daily_maintenance,
+                      daily_at=maintenance_time)
         logger.info(f"✅ Scheduled daily maintenance at {maintenance_time}")
-        
-        logger.info(f"📋 Total scheduled jobs: {len(schedule.jobs)}")
-    
-    def _is_market_hours(self) -> bool:
-        """Check if current time is during NASDAQ market hours (2:30 PM - 9:00 PM UTC)."""
-        try:
-            from .config import config
-            current_time = datetime.now(self.timezone)
-            
-            # Check if it's a weekday (Monday = 0, Sunday = 6)
-            if current_time.weekday() > 4:  # Saturday = 5, Sunday = 6
-                return False
-            
-            current_time_only = current_time.time()
-            market_open = time(config.MARKET_OPEN_HOUR, config.MARKET_OPEN_MINUTE)
-            market_close = time(config.MARKET_CLOSE_HOUR, config.MARKET_CLOSE_MINUTE)
-            
-            return market_open <= current_time_only <= market_close
-            
-        except Exception as e:
-            logger.warning(f"Error checking market hours: {e}")
+
+        logger.info(f"📋 Total scheduled jobs: {len(self._job_defs)}")
+
+    def _add_job(self, job_name: str, callback: Callable,
+                 interval_seconds: Optional[float] = None,
+                 daily_at: Optional[str] = None,
+                 delay_fn: Optional[Callable[[], float]] = None):
+        """
+        Register a job and push its first due time onto the heap.
+
+        Args:
+            job_name: Unique identifier for the job
+            callback: Synchronous callable to invoke when the job is due
+            interval_seconds: Recurring interval in seconds (fixed-rate jobs)
+            daily_at: "HH:MM" wall-clock time for once-a-day jobs
+            delay_fn: Callable returning the next delay in seconds, for jobs
+                whose cadence depends on runtime state (e.g. market hours)
+        """
+        if delay_fn is not None:
+            delay = delay_fn()
+        elif interval_seconds is not None:
+            delay = interval_seconds
+        else:
+            delay = self._seconds_until_daily(daily_at)
+
+        loop = asyncio.get_running_loop()
+        self._job_defs[job_name] = {
+            'callback': callback,
+            'interval_seconds': interval_seconds,
+            'daily_at': daily_at,
+            'delay_fn': delay_fn,
+            'next_run': datetime.now(self.timezone) + timedelta(seconds=delay)
+        }
+        heapq.heappush(self._jobs_heap, (loop.time() + delay, next(self._job_seq), job_name))
+        self._schedule_info_cache = None
+        self._wake_event.set()
+
+    def _market_tick_delay(self) -> float:
+        """Next delay for the market-hours job: the normal interval while the
+        market is open, otherwise the gap to the next market open."""
+        now = datetime.now(self.timezone)
+        if self._is_market_hours(now):
+            return config.REALTIME_INTERVAL * 60
+        return self._seconds_until_market_open(now)
+
+    def _seconds_until_market_open(self, now: datetime) -> float:
+        """Seconds until the next weekday market open."""
+        target = now.replace(hour=config.MARKET_OPEN_HOUR, minute=config.MARKET_OPEN_MINUTE,
+                             second=0, microsecond=0)
+        while target <= now or target.weekday() >= 5:
+            target += timedelta(days=1)
+        return (target - now).total_seconds()
+
+    def _seconds_until_daily(self, daily_at: str) -> float:
+        """Seconds until the next occurrence of an "HH:MM" wall-clock time."""
+        hour, minute = (int(part) for part in daily_at.split(':'))
+        now = datetime.now(self.timezone)
+        target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if target <= now:
+            target += timedelta(days=1)
+        return (target - now).total_seconds()
+
+    def _spawn(self, coro):
+        """Launch a job coroutine as a tracked task so stop() can await it."""
+        task = asyncio.create_task(coro)
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+        return task
+
+    def _next_run_wall(self) -> Optional[datetime]:
+        """Wall-clock time of the nearest scheduled job, if any."""
+        if not self._jobs_heap:
+            return None
+        # The heap top is the nearest job, so no scan over the definitions
+        return self._job_defs[self._jobs_heap[0][2]]['next_run']
+
+    def _is_market_hours(self, now: datetime) -> bool:
+        """Check if the given time is within NASDAQ market hours (2:30 PM - 9:00 PM UTC)."""
+        # Market is closed on weekends
+        current_weekday = now.weekday()
+        if current_weekday >= 5:  # Saturday = 5, Sunday = 6
+            logger.debug("📅 Weekend detected (weekday {}), market closed", current_weekday)
             return False
-    
+
+        current_time = now.time()
+        is_open = self._market_open <= current_time <= self._market_close
+
+        # lazy=True defers the strftime calls until a sink accepts DEBUG
+        logger.opt(lazy=True).debug(
+            "🕐 Market is {state}: {t} vs {o}-{c}",
+            state=lambda: "open" if is_open else "closed",
+            t=lambda: current_time.strftime('%H:%M:%S'),
+            o=lambda: self._market_open.strftime('%H:%M'),
+            c=lambda: self._market_close.strftime('%H:%M')
+        )
+
+        return is_open
+
     def _run_market_hours_ingestion(self):
         """Run ingestion only during market hours."""
         current_time = datetime.now(self.timezone)
-        logger.info(f"🕐 Market hours ingestion triggered at {current_time.strftime('%Y-%m-%d %H:%M:%S %Z')}")
-        
-        if self._is_market_hours():
+        # isoformat is noticeably cheaper than strftime and these lines fire
+        # on every tick
+        logger.info(f"🕐 Market hours ingestion triggered at {current_time.isoformat(timespec='seconds')}")
+
+        if self._is_market_hours(current_time):
             logger.info("✅ Market hours ingestion: NASDAQ market is open, proceeding with stock ingestion")
-            asyncio.create_task(self._safe_run_ingestion())
+            self._spawn(self._safe_run_ingestion())
         else:
             logger.info("⏸️  Market hours ingestion: NASDAQ market is closed, skipping stock ingestion")
-            logger.debug(f"🔍 Market status check: weekday={current_time.weekday()}, time={current_time.time()}")
+            logger.debug("🔍 Market status check: weekday={}, time={}", current_time.weekday(), current_time.time())
     
     def _run_crypto_ingestion(self):
         """Run 24/7 cryptocurrency ingestion."""
         current_time = datetime.now(self.timezone)
-        logger.info(f"🪙 Crypto ingestion triggered at {current_time.strftime('%Y-%m-%d %H:%M:%S %Z')}")
+        logger.info(f"🪙 Crypto ingestion triggered at {current_time.isoformat(timespec='seconds')}")
         
         # Crypto trades 24/7, so always run
         logger.info("✅ Crypto ingestion: Running 24/7 cryptocurrency ingestion")
-        asyncio.create_task(self._safe_run_crypto_ingestion())
+        self._spawn(self._safe_run_crypto_ingestion())
     
     def _run_daily_historical_update(self):
         """Run daily historical data update."""
         current_time = datetime.now(self.timezone)
-        logger.info(f"📚 Daily historical update triggered at {current_time.strftime('%Y-%m-%d %H:%M:%S %Z')}")
-        asyncio.create_task(self._safe_run_historical_update())
+        logger.info(f"📚 Daily historical update triggered at {current_time.isoformat(timespec='seconds')}")
+        self._spawn(self._safe_run_historical_update())
     
     def _run_daily_maintenance(self):
         """Run daily maintenance tasks."""
         current_time = datetime.now(self.timezone)
-        logger.info(f"🔧 Daily maintenance triggered at {current_time.strftime('%Y-%m-%d %H:%M:%S %Z')}")
-        asyncio.create_task(self._safe_run_maintenance())
+        logger.info(f"🔧 Daily maintenance triggered at {current_time.isoformat(timespec='seconds')}")
+        self._spawn(self._safe_run_maintenance())
     
     async def _safe_run_ingestion(self):
         """Safely run price ingestion with error handling."""
-        logger.info("🔄 Starting scheduled price ingestion...")
-        start_time = datetime.now()
-        
-        try:
-            results = await self.ingester.ingest_prices()
-            duration = (datetime.now() - start_time).total_seconds()
-            
-            logger.info(
-                f"✅ Scheduled ingestion completed in {duration:.2f}s: "
-                f"{results['symbols_successful']}/{results['symbols_processed']} successful"
-            )
-            
-            if results['errors']:
-                logger.warning(f"⚠️  Scheduled ingestion had {len(results['errors'])} errors:")
-                for error in results['errors']:
-                    logger.warning(f"   • {error}")
-            
-        except Exception as e:
-            duration = (datetime.now() - start_time).total_seconds()
-            logger.error(f"❌ Scheduled ingestion failed after {duration:.2f}s: {type(e).__name__}: {e}")
+        if self._ingest_lock.locked():
+            logger.warning("⚠️  Previous price ingestion still running, skipping this cycle")
+            return
+
+        async with self._ingest_lock:
+            logger.info("🔄 Starting scheduled price ingestion...")
+            start_time = monotonic()
+
+            try:
+                results = await self.ingester.ingest_prices()
+                duration = monotonic() - start_time
+
+                logger.info(
+                    f"✅ Scheduled ingestion completed in {duration:.2f}s: "
+                    f"{results['symbols_successful']}/{results['symbols_processed']} successful"
+                )
+
+                if results['errors']:
+                    logger.warning(f"⚠️  Scheduled ingestion had {len(results['errors'])} errors:")
+                    for error in results['errors']:
+                        logger.warning(f"   • {error}")
+
+            except Exception as e:
+                duration = monotonic() - start_time
+                logger.error(f"❌ Scheduled ingestion failed after {duration:.2f}s: {type(e).__name__}: {e}")
     
     async def _safe_run_crypto_ingestion(self):
         """Safely run cryptocurrency ingestion with error handling."""
+        if self._crypto_lock.locked():
+            logger.warning("⚠️  Previous crypto ingestion still running, skipping this cycle")
+            return
+
+        async with self._crypto_lock:
+            await self._run_crypto_ingestion_locked()
+
+    async def _run_crypto_ingestion_locked(self):
+        """Cryptocurrency ingestion body, run under _crypto_lock."""
         logger.info("🪙 Starting scheduled cryptocurrency ingestion...")
-        start_time = datetime.now()
-        
+        start_time = monotonic()
+
         try:
-            # Get crypto symbols from the ingester
-            crypto_symbols = [symbol for symbol in self.ingester.symbols 
-                            if hasattr(self.ingester, '_is_crypto_symbol') and 
-                            self.ingester._is_crypto_symbol(symbol)]
+            # Get crypto symbols from the ingester; symbols added through the
+            # ingester directly fall back to the memoized classifier
+            crypto_symbols = [symbol for symbol in self.ingester.symbols
+                              if symbol in self._crypto_symbols or self._is_crypto_symbol(symbol)]
             
             if not crypto_symbols:
                 logger.info("🪙 No cryptocurrency symbols configured, skipping crypto ingestion")
                 return
             
-            logger.info(f"🪙 Processing {len(crypto_symbols)} cryptocurrency symbols: {crypto_symbols}")
-            
-            # Run ingestion for crypto symbols only
-            successful_updates = 0
-            failed_updates = 0
-            
-            for symbol in crypto_symbols:
-                try:
-                    logger.info(f"🪙 Ingesting {symbol}...")
-                    await self.ingester.ingest_symbol(symbol)
-                    successful_updates += 1
-                    logger.info(f"✅ {symbol} ingestion completed")
-                except Exception as e:
-                    failed_updates += 1
-                    logger.error(f"❌ {symbol} ingestion failed: {type(e).__name__}: {e}")
-                
-                # Small delay between symbols to avoid rate limits
-                await asyncio.sleep(1)
-            
-            duration = (datetime.now() - start_time).total_seconds()
-            logger.info(
+            logger.debug("🪙 Processing {} cryptocurrency symbols: {}", len(crypto_symbols), crypto_symbols)
+
+            # Fan out with bounded concurrency; the data sources' token
+            # buckets already pace the outbound API calls
+            async def ingest_one(symbol: str) -> bool:
+                async with self._crypto_sem:
+                    try:
+                        logger.debug("🪙 Ingesting {}...", symbol)
+                        await self.ingester.ingest_symbol(symbol)
+                        return True
+                    except Exception as e:
+                        logger.error(f"❌ {symbol} ingestion failed: {type(e).__name__}: {e}")
+                        return False
+
+            results = await asyncio.gather(*(ingest_one(s) for s in crypto_symbols))
+            successful_updates = sum(results)
+            failed_updates = len(results) - successful_updates
+
+            duration = monotonic() - start_time
+            # One structured record per run; the JSON sink serializes the
+            # per-symbol statuses as a bound extra instead of N records
+            logger.bind(symbols=list(zip(crypto_symbols, results))).info(
                 f"🪙 Cryptocurrency ingestion completed in {duration:.2f}s: "
                 f"{successful_updates} successful, {failed_updates} failed"
             )
             
         except Exception as e:
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = monotonic() - start_time
             logger.error(f"❌ Cryptocurrency ingestion failed after {duration:.2f}s: {type(e).__name__}: {e}")
     
     async def _safe_run_historical_update(self):
         """Safely run historical data update."""
+        if self._historical_lock.locked():
+            logger.warning("⚠️  Previous historical update still running, skipping this run")
+            return
+
+        async with self._historical_lock:
+            await self._run_historical_update_locked()
+
+    async def _run_historical_update_locked(self):
+        """Historical update body, run under _historical_lock."""
         logger.info("📚 Starting scheduled historical data update...")
-        start_time = datetime.now()
-        
+        start_time = monotonic()
+
         try:
             total_symbols = len(config.TRACKED_SYMBOLS)
-            successful_updates = 0
-            failed_updates = 0
-            
-            logger.info(f"📊 Processing {total_symbols} symbols for historical update...")
-            
-            for i, symbol in enumerate(config.TRACKED_SYMBOLS, 1):
-                logger.info(f"🔄 Processing {symbol} ({i}/{total_symbols}) for historical update...")
-                
-                try:
-                    success = await self.ingester.ingest_historical_data(symbol, days=30)
-                    if success:
-                        successful_updates += 1
-                        logger.info(f"✅ Updated historical data for {symbol}")
-                    else:
-                        failed_updates += 1
-                        logger.warning(f"⚠️  Failed to update historical data for {symbol}")
-                    
-                except Exception as e:
-                    failed_updates += 1
-                    logger.error(f"❌ Error updating historical data for {symbol}: {type(e).__name__}: {e}")
-                
-                # Small delay between symbols to avoid rate limits
-                if i < total_symbols:  # Don't delay after the last symbol
-                    logger.debug(f"⏳ Waiting 2 seconds before next symbol...")
-                    await asyncio.sleep(2)
-            
-            duration = (datetime.now() - start_time).total_seconds()
-            logger.info(
+            logger.debug("📊 Processing {} symbols for historical update...", total_symbols)
+
+            # Bounded fanout; per-source token buckets pace the API calls
+            sem = asyncio.Semaphore(config.HISTORICAL_CONCURRENCY)
+
+            async def update_one(symbol: str) -> bool:
+                async with sem:
+                    logger.debug("🔄 Processing {} for historical update...", symbol)
+                    return await self.ingester.ingest_historical_data(symbol, days=30)
+
+            results = await asyncio.gather(
+                *(update_one(s) for s in config.TRACKED_SYMBOLS),
+                return_exceptions=True
+            )
+
+            statuses = []
+            errors = {}
+            for symbol, result in zip(config.TRACKED_SYMBOLS, results):
+                statuses.append((symbol, result is True))
+                if isinstance(result, Exception):
+                    errors[symbol] = f"{type(result).__name__}: {result}"
+            successful_updates = sum(ok for _, ok in statuses)
+            failed_updates = total_symbols - successful_updates
+
+            duration = monotonic() - start_time
+            # Single structured summary instead of three records per symbol
+            logger.bind(symbols=statuses).info(
                 f"📚 Historical data update completed in {duration:.2f}s: "
                 f"{successful_updates} successful, {failed_updates} failed"
             )
+            if errors:
+                logger.warning("⚠️  Historical update errors: {}", errors)
                 
         except Exception as e:
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = monotonic() - start_time
             logger.error(f"❌ Historical data update failed after {duration:.2f}s: {type(e).__name__}: {e}")
     
     async def _safe_run_maintenance(self):
         """Safely run maintenance tasks."""
-        logger.info("🔧 Starting scheduled daily maintenance...")
-        start_time = datetime.now()
-        
-        try:
-            # Clean up old cache entries
-            if hasattr(self.ingester, 'cache_manager'):
-                logger.info("🧹 Cleaning up old cache entries...")
-                await self.ingester.cache_manager.clear_cache("price:*:historical:*")
-                logger.info("✅ Cache cleanup completed")
-            else:
-                logger.warning("⚠️  Cache manager not available for maintenance")
-            
-            duration = (datetime.now() - start_time).total_seconds()
-            logger.info(f"✅ Daily maintenance completed in {duration:.2f}s")
-            
-        except Exception as e:
-            duration = (datetime.now() - start_time).total_seconds()
-            logger.error(f"❌ Daily maintenance failed after {duration:.2f}s: {type(e).__name__}: {e}")
+        if self._maintenance_lock.locked():
+            logger.warning("⚠️  Previous maintenance run still in progress, skipping")
+            return
+
+        async with self._maintenance_lock:
+            logger.info("🔧 Starting scheduled daily maintenance...")
+            start_time = monotonic()
+
+            try:
+                # Clean up old cache entries
+                if hasattr(self.ingester, 'cache_manager'):
+                    logger.info("🧹 Cleaning up old cache entries...")
+                    await self.ingester.cache_manager.clear_cache("price:*:historical:*")
+                    logger.info("✅ Cache cleanup completed")
+                else:
+                    logger.warning("⚠️  Cache manager not available for maintenance")
+
+                duration = monotonic() - start_time
+                logger.info(f"✅ Daily maintenance completed in {duration:.2f}s")
+
+            except Exception as e:
+                duration = monotonic() - start_time
+                logger.error(f"❌ Daily maintenance failed after {duration:.2f}s: {type(e).__name__}: {e}")
     
     async def _scheduler_loop(self):
-        """Main scheduler loop."""
+        """Main scheduler loop: sleep until the nearest job is due, fire it, re-arm it."""
         logger.info("🔄 Scheduler loop started")
-        
+        loop = asyncio.get_running_loop()
+
         while self.running:
             try:
-                # Run pending scheduled jobs
-                pending_jobs = schedule.jobs
-                if pending_jobs:
-                    logger.debug(f"📋 Checking {len(pending_jobs)} scheduled jobs...")
-                    schedule.run_pending()
+                self._wake_event.clear()
+
+                if not self._jobs_heap:
+                    # Nothing scheduled - wait until a job is added or stop() fires
+                    logger.debug("📋 No scheduled jobs, waiting for wake event")
+                    await self._wake_event.wait()
+                    continue
+
+                delay = self._jobs_heap[0][0] - loop.time()
+                if delay > 0:
+                    # Sleep exactly until the nearest due time; a wake event
+                    # (new job or shutdown) interrupts early to re-examine
+                    try:
+                        await asyncio.wait_for(self._wake_event.wait(), timeout=delay)
+                        continue
+                    except asyncio.TimeoutError:
+                        pass
+
+                _, _, job_name = heapq.heappop(self._jobs_heap)
+                job = self._job_defs.get(job_name)
+                if job is None:
+                    continue
+
+                logger.debug("📋 Running due job: {}", job_name)
+                try:
+                    job['callback']()
+                except Exception as e:
+                    logger.error(f"❌ Scheduled job {job_name} failed: {type(e).__name__}: {e}")
+
+                # Re-arm the job for its next occurrence
+                if job['delay_fn'] is not None:
+                    delay = job['delay_fn']()
+                elif job['interval_seconds'] is not None:
+                    delay = job['interval_seconds']
                 else:
-                    logger.debug("📋 No scheduled jobs to check")
-                
-                # Sleep for a short interval
-                await asyncio.sleep(30)  # Check every 30 seconds
-                
+                    delay = self._seconds_until_daily(job['daily_at'])
+                job['next_run'] = datetime.now(self.timezone) + timedelta(seconds=delay)
+                heapq.heappush(self._jobs_heap,
+                               (loop.time() + delay, next(self._job_seq), job_name))
+                self._schedule_info_cache = None
+
             except asyncio.CancelledError:
                 logger.info("🔄 Scheduler loop cancelled")
                 break
@@ -368,39 +536,20 @@ class PriceScheduler:
                 logger.error(f"❌ Scheduler loop error: {type(e).__name__}: {e}")
                 logger.error(f"🔍 Scheduler error details: {str(e)}")
                 await asyncio.sleep(60)  # Longer sleep on error
-        
+
         logger.info("🔄 Scheduler loop stopped")
     
-    def _is_market_hours(self) -> bool:
-        """Check if current time is within market hours."""
-        now = datetime.now(self.timezone)
-        current_time = now.time()
-        current_weekday = now.weekday()
-        
-        # Market is closed on weekends
-        if current_weekday >= 5:  # Saturday = 5, Sunday = 6
-            logger.debug(f"📅 Weekend detected (weekday {current_weekday}), market closed")
-            return False
-        
-        # Check if within trading hours (9:30 AM - 4:00 PM ET)
-        market_start = time(config.MARKET_OPEN_HOUR, config.MARKET_OPEN_MINUTE)
-        market_end = time(config.MARKET_CLOSE_HOUR, config.MARKET_CLOSE_MINUTE)
-        
-        is_open = market_start <= current_time <= market_end
-        
-        if is_open:
-            logger.debug(f"🕐 Market is open: {current_time.strftime('%H:%M:%S')} is within {market_start.strftime('%H:%M')}-{market_end.strftime('%H:%M')}")
-        else:
-            logger.debug(f"🕐 Market is closed: {current_time.strftime('%H:%M:%S')} is outside {market_start.strftime('%H:%M')}-{market_end.strftime('%H:%M')}")
-        
-        return is_open
-    
     def _is_trading_day(self) -> bool:
         """Check if today is a trading day (simplified - doesn't account for holidays)."""
         today = datetime.now(self.timezone)
         is_trading_day = today.weekday() < 5  # Monday = 0, Friday = 4
-        
-        logger.debug(f"📅 Trading day check: weekday {today.weekday()} ({today.strftime('%A')}), is_trading_day: {is_trading_day}")
+
+        logger.opt(lazy=True).debug(
+            "📅 Trading day check: weekday {wd} ({day}), is_trading_day: {ok}",
+            wd=lambda: today.weekday(),
+            day=lambda: today.strftime('%A'),
+            ok=lambda: is_trading_day
+        )
         return is_trading_day
     
     async def trigger_manual_ingestion(self):
@@ -410,33 +559,37 @@ class PriceScheduler:
     
     async def get_next_scheduled_run(self) -> Optional[str]:
         """Get the next scheduled run time."""
-        if not schedule.jobs:
+        next_run = self._next_run_wall()
+        if next_run is None:
             logger.debug("📋 No scheduled jobs found")
             return None
-        
-        next_run = min(job.next_run for job in schedule.jobs)
-        next_run_str = next_run.isoformat() if next_run else None
-        
-        logger.debug(f"📋 Next scheduled run: {next_run_str}")
+
+        next_run_str = next_run.isoformat()
+        logger.debug("📋 Next scheduled run: {}", next_run_str)
         return next_run_str
-    
+
     def get_schedule_info(self) -> dict:
         """Get information about scheduled jobs."""
-        schedule_info = {
-            'running': self.running,
-            'total_jobs': len(schedule.jobs),
-            'market_hours_interval': config.REALTIME_INTERVAL,
-            'timezone': str(self.timezone),
-            'jobs': [
+        # The per-job dicts only change when a job fires or is added, so
+        # health-check polling between ticks reuses the cached list
+        if self._schedule_info_cache is None:
+            self._schedule_info_cache = [
                 {
-                    'interval': str(job.interval),
-                    'unit': job.unit,
-                    'at_time': str(job.at_time) if job.at_time else None,
-                    'next_run': job.next_run.isoformat() if job.next_run else None
+                    'name': job_name,
+                    'interval_seconds': job['interval_seconds'],
+                    'at_time': job['daily_at'],
+                    'next_run': job['next_run'].isoformat()
                 }
-                for job in schedule.jobs
+                for job_name, job in self._job_defs.items()
             ]
+
+        schedule_info = {
+            'running': self.running,
+            'total_jobs': len(self._job_defs),
+            'market_hours_interval': config.REALTIME_INTERVAL,
+            'timezone': self.timezone_name,
+            'jobs': self._schedule_info_cache
         }
-        
-        logger.debug(f"📋 Schedule info: {schedule_info}")
+
+        logger.debug("📋 Schedule info: {}", schedule_info)
         return schedule_info
\ No newline at end of file
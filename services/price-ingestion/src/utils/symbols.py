@@ -0,0 +1,31 @@
+"""
+Shared symbol classification helpers.
+
+The scheduler, ingester and database layer all need to agree on whether a
+symbol is a cryptocurrency — a symbol routed to the 24/7 crypto job must
+also land in crypto_prices. Keeping the classifier here guarantees one set
+of semantics for all of them.
+"""
+
+import functools
+
+# Known cryptocurrency base symbols; frozenset for O(1) membership
+_CRYPTO_BASES = frozenset({'BTC', 'ETH', 'ADA', 'DOT', 'LINK', 'LTC', 'BCH', 'XRP', 'XLM', 'EOS'})
+
+
+@functools.lru_cache(maxsize=1024)
+def is_crypto_symbol(symbol: str) -> bool:
+    """Check if a symbol is a cryptocurrency (memoized; pure function of the string)."""
+    s = symbol.upper()
+
+    # Pair notation (e.g. BTC/USD, BTC-USD); partition avoids the list
+    # allocation split would make
+    if '/' in s:
+        return s.partition('/')[0] in _CRYPTO_BASES
+    if '-' in s:
+        return s.partition('-')[0] in _CRYPTO_BASES
+
+    # Bare symbol, possibly with a quote suffix (BTCUSD, BTCUSDT);
+    # removesuffix only strips at the end, unlike replace() calls which
+    # also matched mid-string (BTCUSDT -> BTCT)
+    return s.removesuffix('USDT').removesuffix('USD') in _CRYPTO_BASES
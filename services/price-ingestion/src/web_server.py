@@ -2,264 +2,361 @@
 Web server for price ingestion service metrics and health endpoints.
 """
 
-import asyncio
 import json
 import time
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from threading import Thread
-from urllib.parse import urlparse, parse_qs
+
+from aiohttp import web
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 from .utils.logger import logger
 
 
+# The HELP/TYPE scaffolding of the Prometheus exposition never changes, so
+# it lives in one %-template and each build is a single C-level format call
+# instead of ~40 f-string evaluations and a list allocation.
+_PROM_TEMPLATE = """\
+# HELP ingestion_requests_total Total number of ingestion requests
+# TYPE ingestion_requests_total counter
+ingestion_requests_total %s
+
+# HELP ingestion_requests_success_total Total number of successful ingestion requests
+# TYPE ingestion_requests_success_total counter
+ingestion_requests_success_total %s
+
+# HELP ingestion_requests_error_total Total number of failed ingestion requests
+# TYPE ingestion_requests_error_total counter
+ingestion_requests_error_total %s
+
+# HELP ingestion_symbols_processed_total Total number of symbols processed
+# TYPE ingestion_symbols_processed_total counter
+ingestion_symbols_processed_total %s
+
+# HELP ingestion_data_points_stored_total Total number of data points stored
+# TYPE ingestion_data_points_stored_total counter
+ingestion_data_points_stored_total %s
+
+# HELP ingestion_last_run_timestamp Timestamp of last ingestion run
+# TYPE ingestion_last_run_timestamp gauge
+ingestion_last_run_timestamp %s
+
+# HELP ingestion_last_run_duration_seconds Duration of last ingestion run in seconds
+# TYPE ingestion_last_run_duration_seconds gauge
+ingestion_last_run_duration_seconds %s
+
+# HELP ingestion_cache_hits_total Total cache hits
+# TYPE ingestion_cache_hits_total counter
+ingestion_cache_hits_total %s
+
+# HELP ingestion_cache_misses_total Total cache misses
+# TYPE ingestion_cache_misses_total counter
+ingestion_cache_misses_total %s
+
+# HELP ingestion_api_calls_total Total API calls made
+# TYPE ingestion_api_calls_total counter
+ingestion_api_calls_total %s
+
+# HELP ingestion_database_operations_total Total database operations
+# TYPE ingestion_database_operations_total counter
+ingestion_database_operations_total %s
+
+# HELP ingestion_service_status Service health status (1=healthy, 0=unhealthy)
+# TYPE ingestion_service_status gauge
+ingestion_service_status %s
+
+# HELP ingestion_uptime_seconds Service uptime in seconds
+# TYPE ingestion_uptime_seconds gauge
+ingestion_uptime_seconds %s"""
+
+
+def _json_dumps(data) -> bytes:
+    """Serialize a response payload to pretty-printed JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+# [epoch, iso-string] pair backing _iso_now's 1-second cache
+_TS_CACHE = [0.0, ""]
+
+
+def _iso_now() -> str:
+    """UTC ISO timestamp, reformatted at most once per second."""
+    now = time.time()
+    if now - _TS_CACHE[0] > 1.0:
+        _TS_CACHE[0] = now
+        _TS_CACHE[1] = datetime.utcfromtimestamp(now).isoformat()
+    return _TS_CACHE[1]
+
+
+class _AtomicCounter:
+    """Scalar counter whose increment is a single attribute add under the GIL,
+    avoiding the dict get/setitem pair of the old read-modify-write."""
+    __slots__ = ('v',)
+
+    def __init__(self):
+        self.v = 0
+
+    def inc(self, n=1):
+        self.v += n
+
+
+@dataclass(slots=True)
+class MetricsState:
+    """Fixed-layout gauge storage. The gauge set is known up front, so a
+    slots dataclass turns every read into a slot offset instead of a dict
+    hash+lookup and rejects typo'd metric names outright."""
+    ingestion_last_run_timestamp: float = 0.0
+    ingestion_last_run_duration_seconds: float = 0.0
+    ingestion_service_status: int = 1  # 1 = healthy, 0 = unhealthy
+    ingestion_errors_by_source: dict = field(default_factory=dict)
+
+
 class MetricsCollector:
     """Collects and stores metrics for the ingestion service."""
-    
+
+    __slots__ = ('metrics', '_counters', 'start_time', '_wallclock_start',
+                 '_cached_bytes', '_cache_ts', '_dirty')
+
     def __init__(self):
-        self.metrics = {
-            'ingestion_requests_total': 0,
-            'ingestion_requests_success_total': 0,
-            'ingestion_requests_error_total': 0,
-            'ingestion_symbols_processed_total': 0,
-            'ingestion_data_points_stored_total': 0,
-            'ingestion_last_run_timestamp': 0,
-            'ingestion_last_run_duration_seconds': 0,
-            'ingestion_cache_hits_total': 0,
-            'ingestion_cache_misses_total': 0,
-            'ingestion_api_calls_total': 0,
-            'ingestion_database_operations_total': 0,
-            'ingestion_errors_by_source': {},
-            'ingestion_service_status': 1,  # 1 = healthy, 0 = unhealthy
-        }
-        self.start_time = time.time()
+        # Gauges and structured values; scalar counters live separately so
+        # the hot recording path is one attribute add
+        self.metrics = MetricsState()
+        self._counters = {name: _AtomicCounter() for name in (
+            'ingestion_requests_total',
+            'ingestion_requests_success_total',
+            'ingestion_requests_error_total',
+            'ingestion_symbols_processed_total',
+            'ingestion_data_points_stored_total',
+            'ingestion_cache_hits_total',
+            'ingestion_cache_misses_total',
+            'ingestion_api_calls_total',
+            'ingestion_database_operations_total',
+        )}
+        # Monotonic for uptime arithmetic (NTP steps can drive a wall-clock
+        # delta negative); wall clock kept for anything needing an epoch
+        self.start_time = time.monotonic()
+        self._wallclock_start = time.time()
+        # Cached Prometheus exposition bytes; rebuilt when a metric changes
+        # or the 1-second TTL lapses (the uptime gauge moves with time)
+        self._cached_bytes = None
+        self._cache_ts = 0.0
+        self._dirty = True
         logger.info("📊 Metrics collector initialized")
     
     def increment_counter(self, metric_name, value=1, labels=None):
         """Increment a counter metric."""
         if labels:
-            # Handle labeled metrics
-            if metric_name not in self.metrics:
-                self.metrics[metric_name] = {}
+            # Handle labeled metrics as flattened counter names
             for label_key, label_value in labels.items():
                 key = f"{metric_name}_{label_key}_{label_value}"
-                self.metrics[key] = self.metrics.get(key, 0) + value
+                counter = self._counters.get(key)
+                if counter is None:
+                    # Cap label cardinality so a misbehaving label value
+                    # can't grow the counter table without bound
+                    if len(self._counters) >= 10000:
+                        continue
+                    counter = self._counters[key] = _AtomicCounter()
+                counter.inc(value)
         else:
-            self.metrics[metric_name] = self.metrics.get(metric_name, 0) + value
-    
+            counter = self._counters.get(metric_name)
+            if counter is None:
+                counter = self._counters[metric_name] = _AtomicCounter()
+            counter.inc(value)
+        self._dirty = True
+
     def set_gauge(self, metric_name, value):
-        """Set a gauge metric."""
-        self.metrics[metric_name] = value
-    
+        """Set a gauge metric. Unknown names raise AttributeError."""
+        setattr(self.metrics, metric_name, value)
+        self._dirty = True
+
     def record_ingestion_run(self, duration_seconds, success=True):
         """Record an ingestion run."""
-        self.metrics['ingestion_last_run_timestamp'] = time.time()
-        self.metrics['ingestion_last_run_duration_seconds'] = duration_seconds
+        self.metrics.ingestion_last_run_timestamp = time.time()
+        self.metrics.ingestion_last_run_duration_seconds = duration_seconds
         if success:
             self.increment_counter('ingestion_requests_success_total')
         else:
             self.increment_counter('ingestion_requests_error_total')
         self.increment_counter('ingestion_requests_total')
     
+    def snapshot(self) -> dict:
+        """Point-in-time view of all counters and gauges for /status."""
+        data = {name: counter.v for name, counter in self._counters.items()}
+        data.update(asdict(self.metrics))
+        return data
+
     def get_prometheus_metrics(self):
-        """Generate Prometheus-format metrics."""
-        lines = []
-        
-        # Add help and type information
-        lines.extend([
-            "# HELP ingestion_requests_total Total number of ingestion requests",
-            "# TYPE ingestion_requests_total counter",
-            f"ingestion_requests_total {self.metrics.get('ingestion_requests_total', 0)}",
-            "",
-            "# HELP ingestion_requests_success_total Total number of successful ingestion requests",
-            "# TYPE ingestion_requests_success_total counter", 
-            f"ingestion_requests_success_total {self.metrics.get('ingestion_requests_success_total', 0)}",
-            "",
-            "# HELP ingestion_requests_error_total Total number of failed ingestion requests",
-            "# TYPE ingestion_requests_error_total counter",
-            f"ingestion_requests_error_total {self.metrics.get('ingestion_requests_error_total', 0)}",
-            "",
-            "# HELP ingestion_symbols_processed_total Total number of symbols processed",
-            "# TYPE ingestion_symbols_processed_total counter",
-            f"ingestion_symbols_processed_total {self.metrics.get('ingestion_symbols_processed_total', 0)}",
-            "",
-            "# HELP ingestion_data_points_stored_total Total number of data points stored",
-            "# TYPE ingestion_data_points_stored_total counter",
-            f"ingestion_data_points_stored_total {self.metrics.get('ingestion_data_points_stored_total', 0)}",
-            "",
-            "# HELP ingestion_last_run_timestamp Timestamp of last ingestion run",
-            "# TYPE ingestion_last_run_timestamp gauge",
-            f"ingestion_last_run_timestamp {self.metrics.get('ingestion_last_run_timestamp', 0)}",
-            "",
-            "# HELP ingestion_last_run_duration_seconds Duration of last ingestion run in seconds",
-            "# TYPE ingestion_last_run_duration_seconds gauge", 
-            f"ingestion_last_run_duration_seconds {self.metrics.get('ingestion_last_run_duration_seconds', 0)}",
-            "",
-            "# HELP ingestion_cache_hits_total Total cache hits",
-            "# TYPE ingestion_cache_hits_total counter",
-            f"ingestion_cache_hits_total {self.metrics.get('ingestion_cache_hits_total', 0)}",
-            "",
-            "# HELP ingestion_cache_misses_total Total cache misses", 
-            "# TYPE ingestion_cache_misses_total counter",
-            f"ingestion_cache_misses_total {self.metrics.get('ingestion_cache_misses_total', 0)}",
-            "",
-            "# HELP ingestion_api_calls_total Total API calls made",
-            "# TYPE ingestion_api_calls_total counter",
-            f"ingestion_api_calls_total {self.metrics.get('ingestion_api_calls_total', 0)}",
-            "",
-            "# HELP ingestion_database_operations_total Total database operations",
-            "# TYPE ingestion_database_operations_total counter", 
-            f"ingestion_database_operations_total {self.metrics.get('ingestion_database_operations_total', 0)}",
-            "",
-            "# HELP ingestion_service_status Service health status (1=healthy, 0=unhealthy)",
-            "# TYPE ingestion_service_status gauge",
-            f"ingestion_service_status {self.metrics.get('ingestion_service_status', 1)}",
-            "",
-            "# HELP ingestion_uptime_seconds Service uptime in seconds",
-            "# TYPE ingestion_uptime_seconds gauge",
-            f"ingestion_uptime_seconds {time.time() - self.start_time}",
-        ])
-        
-        return "\n".join(lines)
-
-
-class IngestionHTTPHandler(BaseHTTPRequestHandler):
-    """HTTP handler for ingestion service endpoints."""
-    
-    def __init__(self, *args, metrics_collector=None, **kwargs):
-        self.metrics_collector = metrics_collector
-        super().__init__(*args, **kwargs)
-    
-    def do_GET(self):
-        """Handle GET requests."""
-        parsed_path = urlparse(self.path)
-        path = parsed_path.path
-        
-        if path == '/health':
-            self._handle_health()
-        elif path == '/metrics':
-            self._handle_metrics()
-        elif path == '/status':
-            self._handle_status()
-        elif path == '/':
-            self._handle_root()
-        else:
-            self._send_404()
-    
-    def _handle_health(self):
+        """Generate Prometheus-format metrics as encoded bytes."""
+        # Scrapes and health probes between metric updates get the cached
+        # bytes; the short TTL keeps the uptime gauge from going stale
+        now = time.monotonic()
+        if not self._dirty and self._cached_bytes is not None and now - self._cache_ts < 1.0:
+            return self._cached_bytes
+
+        m = self.metrics
+        c = self._counters
+        text = _PROM_TEMPLATE % (
+            c['ingestion_requests_total'].v,
+            c['ingestion_requests_success_total'].v,
+            c['ingestion_requests_error_total'].v,
+            c['ingestion_symbols_processed_total'].v,
+            c['ingestion_data_points_stored_total'].v,
+            m.ingestion_last_run_timestamp,
+            m.ingestion_last_run_duration_seconds,
+            c['ingestion_cache_hits_total'].v,
+            c['ingestion_cache_misses_total'].v,
+            c['ingestion_api_calls_total'].v,
+            c['ingestion_database_operations_total'].v,
+            m.ingestion_service_status,
+            now - self.start_time,
+        )
+
+        self._cached_bytes = text.encode()
+        self._cache_ts = now
+        self._dirty = False
+        return self._cached_bytes
+
+
+# The old handler sent these on every response
+_CORS_HEADERS = {'Access-Control-Allow-Origin': '*'}
+
+
+# The root payload is constant apart from the timestamp, so encode the
+# static portion to bytes once at import; the handler splices the timestamp
+# in with a bytes concat instead of re-serializing the whole dict per hit
+_ROOT_STATIC = {
+    "service": "Stock Price Ingestion Service",
+    "version": "1.0.0",
+    "endpoints": {
+        "/health": "Health check endpoint",
+        "/metrics": "Prometheus metrics endpoint",
+        "/status": "Detailed service status"
+    },
+}
+_ROOT_PREFIX = (
+    orjson.dumps(_ROOT_STATIC) if orjson is not None
+    else json.dumps(_ROOT_STATIC, separators=(',', ':')).encode()
+)[:-1]  # strip the closing brace; the timestamp field re-closes the object
+
+
+class IngestionWebServer:
+    """aiohttp web server for the ingestion service.
+
+    Runs on the service's own event loop instead of a thread-per-request
+    HTTP server, so probe and scrape traffic shares the loop's epoll-driven
+    I/O rather than spawning an OS thread per connection.
+    """
+
+    def __init__(self, port=8080):
+        self.port = port
+        self.metrics_collector = MetricsCollector()
+        self.runner = None
+        logger.info(f"🌐 Web server initialized on port {port}")
+
+    async def _handle_health(self, request):
         """Health check endpoint."""
         health_data = {
             "status": "healthy",
-            "timestamp": datetime.utcnow().isoformat(),
-            "uptime_seconds": time.time() - self.metrics_collector.start_time if self.metrics_collector else 0,
+            "timestamp": _iso_now(),
+            "uptime_seconds": time.monotonic() - self.metrics_collector.start_time,
             "service": "price-ingestion"
         }
-        
-        self._send_json_response(200, health_data)
-    
-    def _handle_metrics(self):
+
+        return web.Response(
+            body=_json_dumps(health_data),
+            content_type='application/json',
+            headers=_CORS_HEADERS,
+        )
+
+    async def _handle_metrics(self, request):
         """Prometheus metrics endpoint."""
-        if self.metrics_collector:
-            metrics_text = self.metrics_collector.get_prometheus_metrics()
-            self._send_text_response(200, metrics_text, content_type="text/plain")
-        else:
-            self._send_text_response(500, "Metrics collector not available")
-    
-    def _handle_status(self):
+        return web.Response(
+            body=self.metrics_collector.get_prometheus_metrics(),
+            content_type='text/plain',
+            headers=_CORS_HEADERS,
+        )
+
+    async def _handle_status(self, request):
         """Service status endpoint."""
+        mc = self.metrics_collector
+        gauges = mc.metrics
         status_data = {
             "service": "price-ingestion",
             "status": "running",
-            "timestamp": datetime.utcnow().isoformat(),
-            "uptime_seconds": time.time() - self.metrics_collector.start_time if self.metrics_collector else 0,
-            "metrics": self.metrics_collector.metrics if self.metrics_collector else {}
+            "timestamp": _iso_now(),
+            "uptime_seconds": time.monotonic() - mc.start_time,
+            # Labeled counters grow with the service's lifetime; the full
+            # set lives on /metrics, so expose only a curated subset here
+            "metrics_endpoint": "/metrics",
+            "last_run_timestamp": gauges.ingestion_last_run_timestamp,
+            "last_run_duration_seconds": gauges.ingestion_last_run_duration_seconds,
+            "service_status": gauges.ingestion_service_status,
         }
-        
-        self._send_json_response(200, status_data)
-    
-    def _handle_root(self):
+
+        return web.Response(
+            body=_json_dumps(status_data),
+            content_type='application/json',
+            headers=_CORS_HEADERS,
+        )
+
+    async def _handle_root(self, request):
         """Root endpoint with service info."""
-        info = {
-            "service": "Stock Price Ingestion Service",
-            "version": "1.0.0",
-            "endpoints": {
-                "/health": "Health check endpoint",
-                "/metrics": "Prometheus metrics endpoint", 
-                "/status": "Detailed service status"
-            },
-            "timestamp": datetime.utcnow().isoformat()
-        }
-        
-        self._send_json_response(200, info)
-    
-    def _send_json_response(self, status_code, data):
-        """Send JSON response."""
-        self.send_response(status_code)
-        self.send_header('Content-Type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(json.dumps(data, indent=2).encode())
-    
-    def _send_text_response(self, status_code, text, content_type="text/plain"):
-        """Send text response."""
-        self.send_response(status_code)
-        self.send_header('Content-Type', content_type)
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(text.encode())
-    
-    def _send_404(self):
-        """Send 404 response."""
-        self.send_response(404)
-        self.send_header('Content-Type', 'application/json')
-        self.end_headers()
-        self.wfile.write(json.dumps({"error": "Not Found"}).encode())
-    
-    def log_message(self, format, *args):
-        """Override to use our logger."""
-        logger.debug(f"HTTP: {format % args}")
+        body = _ROOT_PREFIX + b',"timestamp":"' + _iso_now().encode() + b'"}'
+        return web.Response(
+            body=body,
+            content_type='application/json',
+            headers=_CORS_HEADERS,
+        )
 
+    async def start(self):
+        """Bind and start the web server on the running event loop.
 
-class IngestionWebServer:
-    """Web server for the ingestion service."""
-    
-    def __init__(self, port=8080):
-        self.port = port
-        self.metrics_collector = MetricsCollector()
-        self.server = None
-        self.server_thread = None
-        logger.info(f"🌐 Web server initialized on port {port}")
-    
-    def start(self):
-        """Start the web server in a background thread."""
+        Awaiting the bind here means a port conflict raises straight into
+        the caller's startup path instead of being parked in a background
+        task; once the site is up, serving needs no task of its own.
+        """
         try:
-            def handler(*args, **kwargs):
-                return IngestionHTTPHandler(*args, metrics_collector=self.metrics_collector, **kwargs)
-            
-            self.server = HTTPServer(('0.0.0.0', self.port), handler)
-            self.server_thread = Thread(target=self.server.serve_forever, daemon=True)
-            self.server_thread.start()
-            
-            logger.info(f"🚀 Web server started on http://0.0.0.0:{self.port}")
-            logger.info(f"📋 Available endpoints:")
-            logger.info(f"   - http://localhost:{self.port}/health")
-            logger.info(f"   - http://localhost:{self.port}/metrics") 
-            logger.info(f"   - http://localhost:{self.port}/status")
-            
+            app = web.Application()
+            app.router.add_get('/health', self._handle_health)
+            app.router.add_get('/metrics', self._handle_metrics)
+            app.router.add_get('/status', self._handle_status)
+            app.router.add_get('/', self._handle_root)
+
+            # access_log=None: per-request lines were DEBUG-only before, and
+            # aiohttp formats them even when no sink would accept the record
+            self.runner = web.AppRunner(app, access_log=None)
+            await self.runner.setup()
+            site = web.TCPSite(self.runner, '0.0.0.0', self.port)
+            await site.start()
+
+            # One multi-line record instead of five: a single emit and a
+            # single stream write/flush on container-captured stdout
+            logger.info(
+                "🚀 Web server listening on http://0.0.0.0:{port}\n"
+                "📋 Available endpoints:\n"
+                "   - http://localhost:{port}/health\n"
+                "   - http://localhost:{port}/metrics\n"
+                "   - http://localhost:{port}/status",
+                port=self.port,
+            )
+
         except Exception as e:
-            logger.error(f"❌ Failed to start web server: {e}")
+            logger.error(f"❌ Failed to start web server: {type(e).__name__}: {e}")
             raise
-    
-    def stop(self):
+
+    async def stop(self):
         """Stop the web server."""
-        if self.server:
+        if self.runner:
             logger.info("🛑 Stopping web server...")
-            self.server.shutdown()
-            self.server.server_close()
-            if self.server_thread:
-                self.server_thread.join(timeout=5)
+            await self.runner.cleanup()
             logger.info("✅ Web server stopped")
-    
+
     def get_metrics_collector(self):
         """Get the metrics collector instance."""
         return self.metrics_collector
@@ -4,102 +4,135 @@ Test script for the startup data initialization feature.
 This script tests the current implementation to see what's working.
 """
 
+import asyncio
+import re
 import sys
+from inspect import CO_COROUTINE
 from pathlib import Path
 
 # Add src to Python path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+# Underscore-prefixed names mentioning "startup"; one C-level match per
+# attribute instead of a startswith call plus a lowered-copy substring scan
+_STARTUP_RE = re.compile(r'_.*startup', re.IGNORECASE)
+
 async def test_startup_feature():
     """Test the startup data initialization feature."""
-    print("🧪 Testing startup data initialization feature...")
-    
+    # Collect output lines and write them in one go at the end; each
+    # print() would otherwise take the stdout lock and flush on newline
+    out = ["🧪 Testing startup data initialization feature..."]
+
     try:
         # Import the ingester
         from src.ingester import PriceIngester
-        print("✅ PriceIngester imported successfully")
-        
+        out.append("✅ PriceIngester imported successfully")
+
         # Create instance
         ingester = PriceIngester()
-        print("✅ PriceIngester instance created successfully")
-        
+        out.append("✅ PriceIngester instance created successfully")
+
+        # Materialize the attribute listing once; every membership probe
+        # below is then a set lookup instead of a fresh MRO walk
+        attrs = set(dir(ingester))
+
         # Check if the startup data method exists
-        if hasattr(ingester, '_initialize_startup_data'):
-            print("✅ _initialize_startup_data method exists")
-            
-            # Check method signature
-            import inspect
-            sig = inspect.signature(ingester._initialize_startup_data)
-            print(f"📋 Method signature: {sig}")
-            
+        if '_initialize_startup_data' in attrs:
+            out.append("✅ _initialize_startup_data method exists")
+
+            # Read the code object directly; inspect.signature builds
+            # Parameter objects in pure Python just to print a string here
+            method = ingester._initialize_startup_data
+            code = getattr(method, '__code__', None)
+            if code is not None:
+                params = code.co_varnames[:code.co_argcount]
+                out.append(f"📋 Method parameters: {params}")
+                is_async = bool(code.co_flags & CO_COROUTINE)
+            else:
+                # C-implemented callable; fall back to the slow path
+                import inspect
+                out.append(f"📋 Method signature: {inspect.signature(method)}")
+                is_async = inspect.iscoroutinefunction(method)
+
             # Check if it's async
-            if inspect.iscoroutinefunction(ingester._initialize_startup_data):
-                print("✅ Method is async (correct)")
+            if is_async:
+                out.append("✅ Method is async (correct)")
             else:
-                print("❌ Method is not async (should be async)")
-                
+                out.append("❌ Method is not async (should be async)")
+
         else:
-            print("❌ _initialize_startup_data method does not exist")
-        
+            out.append("❌ _initialize_startup_data method does not exist")
+
         # Check for other required methods
         required_methods = [
             '_check_recent_data_exists',
-            '_populate_startup_historical_data', 
+            '_populate_startup_historical_data',
             '_get_best_historical_source'
         ]
-        
+
         for method_name in required_methods:
-            if hasattr(ingester, method_name):
-                print(f"✅ {method_name} method exists")
+            if method_name in attrs:
+                out.append(f"✅ {method_name} method exists")
             else:
-                print(f"❌ {method_name} method missing")
-        
-        print("\n📊 Current Implementation Status:")
-        print("================================")
-        
+                out.append(f"❌ {method_name} method missing")
+
+        out.append("\n📊 Current Implementation Status:")
+        out.append("================================")
+
         # Check what's currently implemented
-        current_methods = [method for method in dir(ingester) if method.startswith('_') and 'startup' in method.lower()]
+        current_methods = [method for method in attrs if _STARTUP_RE.match(method)]
         if current_methods:
-            print(f"✅ Found startup-related methods: {current_methods}")
+            out.append(f"✅ Found startup-related methods: {current_methods}")
         else:
-            print("❌ No startup-related methods found")
-        
+            out.append("❌ No startup-related methods found")
+
         # Check what's missing
-        missing_methods = [method for method in required_methods if not hasattr(ingester, method)]
+        missing_methods = [method for method in required_methods if method not in attrs]
         if missing_methods:
-            print(f"❌ Missing methods: {missing_methods}")
+            out.append(f"❌ Missing methods: {missing_methods}")
         else:
-            print("✅ All required methods are present")
-        
+            out.append("✅ All required methods are present")
+
         return True
-        
+
     except Exception as e:
-        print(f"❌ Test failed: {type(e).__name__}: {e}")
+        out.append(f"❌ Test failed: {type(e).__name__}: {e}")
         import traceback
-        traceback.print_exc()
+        out.append(traceback.format_exc())
         return False
 
+    finally:
+        # One write + one flush; also keeps the output atomic when several
+        # test runs share a terminal
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
+
 def main():
     """Main test function."""
     print("🚀 Starting startup feature test...")
-    
+
     try:
-        import asyncio
-        success = asyncio.run(test_startup_feature())
-        
+        # Runner with debug pinned off skips asyncio.run's debug-mode
+        # hooks; the coroutine does pure introspection, no I/O
+        with asyncio.Runner(debug=False) as runner:
+            success = runner.run(test_startup_feature())
+
         if success:
-            print("\n🎉 Test completed successfully!")
-            print("\n📋 Summary:")
-            print("The current implementation has a basic startup data initialization method,")
-            print("but it's missing the comprehensive historical data population feature.")
-            print("\nTo implement the full feature, you need to:")
-            print("1. Replace the current _initialize_startup_data method")
-            print("2. Add the missing helper methods")
-            print("3. Test with an empty database")
+            sys.stdout.write(
+                "\n🎉 Test completed successfully!\n"
+                "\n📋 Summary:\n"
+                "The current implementation has a basic startup data initialization method,\n"
+                "but it's missing the comprehensive historical data population feature.\n"
+                "\nTo implement the full feature, you need to:\n"
+                "1. Replace the current _initialize_startup_data method\n"
+                "2. Add the missing helper methods\n"
+                "3. Test with an empty database\n"
+            )
+            sys.stdout.flush()
         else:
             print("\n💥 Test failed!")
             sys.exit(1)
-            
+
     except Exception as e:
         print(f"💥 Fatal error: {type(e).__name__}: {e}")
         sys.exit(1)